@@ -12,6 +12,7 @@ from .utils import os_cache, check_version, get_logger
 from .hashes import file_hash, make_registry
 from .downloaders import (
     HTTPDownloader,
+    AsyncHTTPDownloader,
     FTPDownloader,
     SFTPDownloader,
     DOIDownloader,
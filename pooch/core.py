@@ -8,14 +8,27 @@
 The main Pooch class and a factory function for it.
 """
 import os
+import sys
 import time
+import shutil
+import json
+import random
+import functools
 import contextlib
+import concurrent.futures
 from pathlib import Path
 import shlex
-import shutil
 
 
-from .hashes import hash_matches, file_hash
+from .hashes import (
+    hash_matches,
+    digest_matches,
+    file_hash,
+    hash_algorithm,
+    new_hasher,
+    HashingFile,
+    HashMismatchError,
+)
 from .utils import (
     check_version,
     get_logger,
@@ -24,8 +37,37 @@ from .utils import (
     temporary_file,
     os_cache,
     unique_file_name,
+    parse_url,
 )
-from .downloaders import DOIDownloader, choose_downloader, doi_to_repository
+from .downloaders import (
+    DEFAULT_TIMEOUT,
+    DOIDownloader,
+    choose_downloader,
+    doi_to_repository,
+)
+
+
+# Bind the logger once instead of looking it up on every fetch.
+_LOGGER = get_logger()
+
+# Directories that stream_download already created in this process. Avoids
+# repeating the makedirs call for every file downloaded to the same folder.
+# Entries are re-checked with a (cheap) isdir before being trusted in case
+# the folder was deleted after we created it.
+_CREATED_DIRS = set()
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path(path):
+    """
+    Expand the user directory and fully resolve the given path (cached).
+
+    Resolving symlinks costs several filesystem calls per path component, so
+    remember the result for paths we've already seen. Used by
+    :func:`pooch.retrieve`, which is often called in a loop with the same
+    *path* for many URLs.
+    """
+    return cache_location(path, env=None, version=None).resolve()
 
 
 def retrieve(
@@ -216,9 +258,9 @@ def retrieve(
     if fname is None:
         fname = unique_file_name(url)
     # Make the path absolute.
-    path = cache_location(path, env=None, version=None)
+    path = _resolve_path(str(path))
 
-    full_path = path.resolve() / fname
+    full_path = os.path.join(str(path), fname)
     action, verb = download_action(full_path, known_hash)
 
     if action in ("download", "update"):
@@ -226,11 +268,11 @@ def retrieve(
         # doesn't already exist.
         make_local_storage(path)
 
-        get_logger().info(
+        _LOGGER.info(
             "%s data from '%s' to file '%s'.",
             verb,
             url,
-            str(full_path),
+            full_path,
         )
 
         if downloader is None:
@@ -239,18 +281,18 @@ def retrieve(
         stream_download(url, full_path, known_hash, downloader, pooch=None)
 
         if known_hash is None:
-            get_logger().info(
+            _LOGGER.info(
                 "SHA256 hash of downloaded file: %s\n"
                 "Use this value as the 'known_hash' argument of 'pooch.retrieve'"
                 " to ensure that the file hasn't changed if it is downloaded again"
                 " in the future.",
-                file_hash(str(full_path)),
+                file_hash(full_path),
             )
 
     if processor is not None:
-        return processor(str(full_path), action, None)
+        return processor(full_path, action, None)
 
-    return str(full_path)
+    return full_path
 
 
 def create(
@@ -496,10 +538,17 @@ class Pooch:
         self.urls = dict(urls)
         self.retry_if_failed = retry_if_failed
         self.allow_updates = allow_updates
+        # Whether the local storage folder has already been created and
+        # checked for write permission. Lets fetch skip the filesystem probes
+        # after the first download.
+        self._storage_ready = False
 
-    @property
+    @functools.cached_property
     def abspath(self):
         "Absolute path to the local storage"
+        # Cached because expanding and absolutizing the path is surprisingly
+        # costly when fetch is called in a loop over a large registry (and
+        # self.path never changes after creation).
         return Path(os.path.abspath(os.path.expanduser(str(self.path))))
 
     @property
@@ -561,7 +610,10 @@ class Pooch:
         self._assert_file_in_registry(fname)
 
         url = self.get_url(fname)
-        full_path = self.abspath / fname
+        abspath = self.abspath
+        # Plain string joins are noticeably cheaper than Path arithmetic when
+        # fetching many files and the result is only ever used as a string.
+        full_path = os.path.join(str(abspath), fname)
         known_hash = self.registry[fname]
         action, verb = download_action(full_path, known_hash)
 
@@ -572,15 +624,18 @@ class Pooch:
 
         if action in ("download", "update"):
             # We need to write data, so create the local data directory if it
-            # doesn't already exist.
-            make_local_storage(str(self.abspath))
+            # doesn't already exist. The isdir check catches the folder being
+            # deleted after a previous fetch marked it as ready.
+            if not (self._storage_ready and os.path.isdir(str(abspath))):
+                make_local_storage(str(abspath))
+                self._storage_ready = True
 
-            get_logger().info(
+            _LOGGER.info(
                 "%s file '%s' from '%s' to '%s'.",
                 verb,
                 fname,
                 url,
-                str(self.abspath),
+                str(abspath),
             )
 
             if downloader is None:
@@ -596,9 +651,128 @@ class Pooch:
             )
 
         if processor is not None:
-            return processor(str(full_path), action, self)
+            return processor(full_path, action, self)
+
+        return full_path
+
+    def fetch_many(self, fnames, processor=None, downloader=None, max_workers=8):
+        """
+        Get the absolute paths to several files in the local storage.
+
+        Like :meth:`pooch.Pooch.fetch` but fetching several files at once,
+        downloading them concurrently with a pool of threads. Since downloads
+        are limited by network latency rather than CPU, fetching many small
+        files concurrently can be much faster than fetching them one at a
+        time.
+
+        Parameters
+        ----------
+        fnames : list of str
+            The file names (relative to the *base_url* of the remote data
+            storage) to fetch from the local storage.
+        processor : None or callable
+            If not None, then a function (or callable object) that will be
+            called before returning the full path and after each file has
+            been downloaded. See :ref:`processors` for details.
+        downloader : None or callable
+            If not None, then a function (or callable object) that will be
+            called to download a given URL to a provided local file name. See
+            :ref:`downloaders` for details. Must be safe to call from
+            multiple threads at the same time.
+        max_workers : int
+            Maximum number of threads used to download files concurrently.
+
+        Returns
+        -------
+        full_paths : dict
+            A dictionary mapping each file name to the absolute path
+            (including the file name) of the file in the local storage.
+
+        """
+        for fname in fnames:
+            self._assert_file_in_registry(fname)
+        if not fnames:
+            return {}
+        # Create the local storage once up front instead of letting the
+        # worker threads race to do it on first download. The isdir check
+        # catches the folder being deleted after it was marked as ready.
+        if not (self._storage_ready and os.path.isdir(str(self.abspath))):
+            make_local_storage(str(self.abspath))
+            self._storage_ready = True
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(fnames))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch, fname, processor=processor, downloader=downloader
+                ): fname
+                for fname in fnames
+            }
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+        # Preserve the order the files were requested in
+        return {fname: results[fname] for fname in fnames}
+
+    def verify_all(self, fnames=None, max_workers=None):
+        """
+        Verify the hashes of local files against the registry in parallel.
 
-        return str(full_path)
+        Hashing is CPU-bound (roughly 1 GB/s per core for SHA256), so
+        verifying a large local cache one file at a time leaves most cores
+        idle. This method hashes the files in a pool of worker processes,
+        scaling verification nearly linearly with the number of cores.
+
+        Files are not downloaded or modified, only checked.
+
+        Parameters
+        ----------
+        fnames : list of str or None
+            The file names (relative to the *base_url* of the remote data
+            storage) to verify. If None (default), verifies every file in
+            the registry.
+        max_workers : int or None
+            Maximum number of worker processes to hash with. If None, uses
+            one per available CPU core.
+
+        Returns
+        -------
+        status : dict
+            Dictionary mapping each file name to True if the file exists in
+            the local storage and matches its registry hash, and False
+            otherwise. Same order as *fnames*.
+
+        """
+        if fnames is None:
+            fnames = list(self.registry)
+        for fname in fnames:
+            self._assert_file_in_registry(fname)
+        abspath = str(self.abspath)
+        results = {}
+        jobs = []
+        for fname in fnames:
+            full_path = os.path.join(abspath, fname)
+            if os.path.exists(full_path):
+                jobs.append((fname, full_path))
+            else:
+                results[fname] = False
+        if jobs:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        file_hash, full_path, hash_algorithm(self.registry[fname])
+                    ): fname
+                    for fname, full_path in jobs
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    fname = futures[future]
+                    results[fname] = digest_matches(
+                        future.result(), self.registry[fname]
+                    )
+        # Preserve the order the files were requested in
+        return {fname: results[fname] for fname in fnames}
 
     def _assert_file_in_registry(self, fname):
         """
@@ -649,29 +823,43 @@ class Pooch:
                 # It's a file path
                 fin = stack.enter_context(open(fname, encoding="utf-8"))
 
-            for linenum, line in enumerate(fin):
-                if isinstance(line, bytes):
-                    line = line.decode("utf-8")
-
-                line = line.strip()
-                # skip line comments
-                if line.startswith("#"):
-                    continue
-
+            # Read the whole registry at once and split lines in C instead of
+            # going through the line-by-line file iterator. Registries can
+            # have tens of thousands of entries, so the per-line overhead
+            # adds up.
+            data = fin.read()
+
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+
+        for linenum, line in enumerate(data.splitlines()):
+            line = line.strip()
+            # skip line comments
+            if line.startswith("#"):
+                continue
+
+            # shlex is only needed when entries are quoted or escaped (file
+            # names with spaces). Plain whitespace splitting is much faster
+            # and gives the same result for everything else.
+            if "'" in line or '"' in line or "\\" in line:
                 elements = shlex.split(line)
-                if not len(elements) in [0, 2, 3]:
-                    raise OSError(
-                        f"Invalid entry in Pooch registry file '{fname}': "
-                        f"expected 2 or 3 elements in line {linenum + 1} but got "
-                        f"{len(elements)}. Offending entry: '{line}'"
-                    )
-                if elements:
-                    file_name = elements[0]
-                    file_checksum = elements[1]
-                    if len(elements) == 3:
-                        file_url = elements[2]
-                        self.urls[file_name] = file_url
-                    self.registry[file_name] = file_checksum.lower()
+            else:
+                elements = line.split()
+            if not len(elements) in [0, 2, 3]:
+                raise OSError(
+                    f"Invalid entry in Pooch registry file '{fname}': "
+                    f"expected 2 or 3 elements in line {linenum + 1} but got "
+                    f"{len(elements)}. Offending entry: '{line}'"
+                )
+            if elements:
+                file_name = elements[0]
+                file_checksum = elements[1]
+                if len(elements) == 3:
+                    file_url = elements[2]
+                    self.urls[file_name] = file_url
+                # Intern the hash strings to deduplicate the memory used by
+                # repeated hashes and algorithm prefixes across big registries
+                self.registry[file_name] = sys.intern(file_checksum.lower())
 
     def load_registry_from_doi(self):
         """
@@ -739,6 +927,229 @@ class Pooch:
             raise NotImplementedError(error_msg) from error
         return available
 
+    def is_available_many(self, fnames):
+        """
+        Check availability of multiple remote files without downloading them.
+
+        Functionally equivalent to calling :meth:`Pooch.is_available` for each
+        file but reuses network connections: HTTP(S) checks share a single
+        keep-alive session (amortizing the TCP and TLS handshakes) and FTP
+        checks share one control connection and one directory listing per
+        server.
+
+        Parameters
+        ----------
+        fnames : list of str
+            The file names (relative to the *base_url* of the remote data
+            storage).
+
+        Returns
+        -------
+        status : dict
+            Dictionary mapping each file name to True if the file is
+            available for download and False otherwise. Same order as
+            *fnames*.
+
+        """
+        for fname in fnames:
+            self._assert_file_in_registry(fname)
+        # Group the URLs by server so each group can share a connection.
+        groups = {}
+        for fname in fnames:
+            url = self.get_url(fname)
+            parsed = parse_url(url)
+            key = (parsed["protocol"], parsed["netloc"])
+            groups.setdefault(key, []).append((fname, url, parsed))
+        available = {}
+        for (protocol, netloc), files in groups.items():
+            if protocol in ("http", "https"):
+                available.update(_check_availability_http(files))
+            elif protocol == "ftp":
+                available.update(_check_availability_ftp(netloc, files))
+            else:
+                # No batched implementation for this protocol. Fall back to
+                # the one-connection-per-file check.
+                for fname, _, _ in files:
+                    available[fname] = self.is_available(fname)
+        return {fname: available[fname] for fname in fnames}
+
+
+def _check_availability_http(files):
+    """
+    Check if files are available on an HTTP(S) server using a shared session.
+
+    *files* is a list of ``(fname, url, parsed_url)`` tuples. Returns a
+    dictionary mapping each file name to True/False.
+    """
+    # Lazy import requests to speed up import time
+    import requests  # pylint: disable=C0415
+
+    available = {}
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        for fname, url, _ in files:
+            response = session.head(url, timeout=DEFAULT_TIMEOUT, allow_redirects=True)
+            available[fname] = bool(response.status_code == 200)
+    return available
+
+
+def _check_availability_ftp(netloc, files):
+    """
+    Check if files are available on an FTP server using a shared connection.
+
+    *files* is a list of ``(fname, url, parsed_url)`` tuples. Uses anonymous
+    login and a single directory listing per remote directory. Returns a
+    dictionary mapping each file name to True/False.
+    """
+    import ftplib  # pylint: disable=C0415
+
+    available = {}
+    ftp = ftplib.FTP(timeout=DEFAULT_TIMEOUT)
+    ftp.connect(host=netloc)
+    try:
+        ftp.login()
+        listings = {}
+        for fname, _, parsed in files:
+            directory, file_name = os.path.split(parsed["path"])
+            if directory not in listings:
+                listings[directory] = frozenset(ftp.nlst(directory))
+            available[fname] = file_name in listings[directory]
+    finally:
+        ftp.close()
+    return available
+
+
+def _trust_mtime():
+    """
+    Whether to trust file modification times to skip hash verification.
+
+    Controlled by the ``POOCH_TRUST_MTIME`` environment variable. Off by
+    default since it weakens the guarantee that local files always match the
+    known hash.
+    """
+    return os.environ.get("POOCH_TRUST_MTIME", "false").lower() not in (
+        "false",
+        "0",
+        "",
+    )
+
+
+def _skip_hash():
+    """
+    Whether to skip hash verification of existing files entirely.
+
+    Controlled by the ``POOCH_SKIP_HASH`` environment variable. Off by
+    default. Only use this in trusted environments (like CI runs against a
+    pre-populated cache) since it disables the detection of corrupted or
+    outdated local files.
+    """
+    return os.environ.get("POOCH_SKIP_HASH", "false").lower() not in (
+        "false",
+        "0",
+        "",
+    )
+
+
+def _sidecar_path(path):
+    "Path to the sidecar file recording the last verified hash of a file."
+    return str(path) + ".pooch-verified"
+
+
+def _fast_hash_check(path, known_hash):
+    """
+    Check if a file matches the known hash without actually hashing it.
+
+    Uses a sidecar file (written by :func:`stream_download` after a verified
+    download) that records the size, modification time, and hash of the file
+    when it was last verified. If the size and modification time are
+    unchanged and the recorded hash is the known hash, the file is considered
+    verified.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the file on disk.
+    known_hash : str
+        A known hash (checksum) of the file.
+
+    Returns
+    -------
+    verified : bool
+        True if the sidecar record confirms the file is unchanged since it
+        was last verified against *known_hash*. False otherwise (including
+        when no sidecar file exists).
+
+    """
+    if known_hash is None:
+        return False
+    record = _read_sidecar(path)
+    if record is None:
+        return False
+    try:
+        stats = os.stat(str(path))
+    except OSError:
+        return False
+    return (
+        record.get("size") == stats.st_size
+        and record.get("mtime_ns") == stats.st_mtime_ns
+        and str(record.get("hash", "")).lower() == known_hash.lower()
+    )
+
+
+def _read_sidecar(path):
+    "Read the sidecar record for a file. Returns None if there isn't one."
+    try:
+        with open(_sidecar_path(path), encoding="utf-8") as fin:
+            return json.load(fin)
+    except (OSError, ValueError):
+        return None
+
+
+def _size_mismatch(path, known_hash):
+    """
+    Check if the file size changed since the known hash was last verified.
+
+    Uses the sidecar record written after a verified download. If the
+    recorded hash is the known hash but the current file size differs from
+    the recorded one, the file can't match the hash anymore and a single
+    stat() is enough to know an update is needed (no hashing required).
+    Returns False when there is no usable sidecar record.
+    """
+    if known_hash is None:
+        return False
+    record = _read_sidecar(path)
+    if record is None or str(record.get("hash", "")).lower() != known_hash.lower():
+        return False
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return False
+    return record.get("size") != size
+
+
+def _write_verified_sidecar(path, known_hash):
+    """
+    Record the size, modification time, and hash of a freshly verified file.
+
+    The record is used by :func:`_fast_hash_check` to skip re-hashing the
+    file on later fetches.
+    """
+    stats = os.stat(str(path))
+    record = {
+        "size": stats.st_size,
+        "mtime_ns": stats.st_mtime_ns,
+        "hash": known_hash.lower(),
+    }
+    try:
+        with open(_sidecar_path(path), "w", encoding="utf-8") as fout:
+            json.dump(record, fout)
+    except OSError:
+        # Failing to write the sidecar only means the fast check won't
+        # trigger. Not worth failing the download over it.
+        pass
+
 
 def download_action(path, known_hash):
     """
@@ -746,14 +1157,17 @@ def download_action(path, known_hash):
 
     Parameters
     ----------
-    path : PathLike
+    path : str or PathLike
         The path to the file on disk.
     known_hash : str
         A known hash (checksum) of the file. Will be used to verify the
         download or check if an existing file needs to be updated. By default,
         will assume it's a SHA256 hash. To specify a different hashing method,
         prepend the hash with ``algorithm:``, for example
-        ``md5:pw9co2iun29juoh`` or ``sha1:092odwhi2ujdp2du2od2odh2wod2``.
+        ``md5:pw9co2iun29juoh`` or ``sha1:092odwhi2ujdp2du2od2odh2wod2``. The
+        ``blake3:`` prefix can be used if the `blake3
+        <https://pypi.org/project/blake3/>`__ package is installed (much
+        faster than SHA256 for large files).
 
     Returns
     -------
@@ -766,9 +1180,25 @@ def download_action(path, known_hash):
 
 
     """
-    if not path.exists():
+    if not os.path.exists(path):
         action = "download"
         verb = "Downloading"
+    elif _skip_hash():
+        # Opt-in fast path for CI and other trusted environments: any
+        # existing file is taken at face value without hashing (see
+        # POOCH_SKIP_HASH). Corrupted or outdated files will NOT be detected.
+        action = "fetch"
+        verb = "Fetching"
+    elif _trust_mtime() and _fast_hash_check(path, known_hash):
+        # Opt-in fast path: trust the recorded size/mtime instead of hashing
+        # the entire file again (see POOCH_TRUST_MTIME).
+        action = "fetch"
+        verb = "Fetching"
+    elif _size_mismatch(path, known_hash):
+        # The size changed since this hash was last verified so the file
+        # can't match it anymore. No need to hash to know that.
+        action = "update"
+        verb = "Updating"
     elif not hash_matches(str(path), known_hash):
         action = "update"
         verb = "Updating"
@@ -778,6 +1208,68 @@ def download_action(path, known_hash):
     return action, verb
 
 
+def _download_resumable(url, fname, known_hash, downloader, pooch, file_name):
+    """
+    Download through a downloader that can resume into a ".part" partial.
+
+    The downloader streams into ``fname + ".part"`` (picking up where a
+    previous interrupted download stopped) while feeding the data through a
+    hasher. The partial is only moved over *fname* once the digest matches
+    the known hash, so an interrupted or corrupted download never touches
+    the final file. On a mismatch, the partial is deleted (resuming it
+    could never produce a matching file) and
+    :class:`~pooch.hashes.HashMismatchError` is raised.
+    """
+    partial = fname + ".part"
+    hasher = new_hasher(hash_algorithm(known_hash))
+    downloader(url, fname, pooch, hasher=hasher)
+    try:
+        digest_matches(hasher.hexdigest(), known_hash, strict=True, source=file_name)
+    except HashMismatchError:
+        for leftover in (partial, partial + ".etag"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise
+    os.replace(partial, fname)
+    # The ETag sidecar (if the server sent one) follows the file instead of
+    # being left behind as litter keyed to the partial name.
+    if os.path.exists(partial + ".etag"):
+        os.replace(partial + ".etag", fname + ".etag")
+
+
+def _download_verified(url, tmp, known_hash, downloader, pooch, file_name):
+    """
+    Download the URL to the temporary file and verify its hash.
+
+    If the downloader supports writing to open file objects, the hash is
+    computed while the download is streamed to disk. Otherwise, the file is
+    hashed after the download finishes. Raises
+    :class:`~pooch.hashes.HashMismatchError` if the hash doesn't match
+    *known_hash*.
+    """
+    if known_hash is not None and getattr(
+        downloader, "supports_file_objects", False
+    ):
+        # Hash the data as it's written to disk so we don't have to read
+        # the entire file back for verification. The large write buffer
+        # coalesces the incoming chunks into fewer, bigger write syscalls.
+        with open(tmp, "wb", buffering=2**20) as output:
+            tee = HashingFile(output, algorithm=hash_algorithm(known_hash))
+            downloader(url, tee, pooch)
+        digest_matches(tee.hexdigest(), known_hash, strict=True, source=file_name)
+    else:
+        try:
+            downloader(url, tmp, pooch)
+        finally:
+            # A failed download can leave a ".part" partial file next to
+            # its target (see HTTPDownloader). The temporary target gets a
+            # new name on every attempt, so the partial could never be
+            # resumed and would be leaked in the cache folder.
+            if os.path.exists(tmp + ".part"):
+                os.remove(tmp + ".part")
+        hash_matches(tmp, known_hash, strict=True, source=file_name)
+
+
 def stream_download(url, fname, known_hash, downloader, pooch=None, retry_if_failed=0):
     """
     Stream the file and check that its hash matches the known one.
@@ -786,6 +1278,16 @@ def stream_download(url, fname, known_hash, downloader, pooch=None, retry_if_fai
     It will be moved to the desired file name only if the hash matches the
     known hash. Otherwise, the temporary file is deleted.
 
+    If the downloader can hash while downloading into a resumable ".part"
+    partial file (it sets the ``supports_hashers`` attribute to True, like
+    :class:`~pooch.HTTPDownloader`), an interrupted download of a large file
+    can pick up from where it stopped on the next attempt. Otherwise, if the
+    downloader supports writing to open file objects (the
+    ``supports_file_objects`` attribute), the hash is computed while the
+    download is streamed to disk, avoiding a full re-read of the file for
+    verification. Failing both, the file is hashed after the download
+    finishes.
+
     If the download fails for either a bad connection or a hash mismatch, we
     will retry the download the specified number of times in case the failure
     was due to a network error.
@@ -794,29 +1296,96 @@ def stream_download(url, fname, known_hash, downloader, pooch=None, retry_if_fai
     import requests.exceptions  # pylint: disable=C0415
 
     # Ensure the parent directory exists in case the file is in a subdirectory.
-    # Otherwise, move will cause an error.
-    if not fname.parent.exists():
-        os.makedirs(str(fname.parent))
+    # Otherwise, move will cause an error. Keep track of directories we
+    # already created to avoid repeating the filesystem calls for every file,
+    # but re-check that they are still there in case the cache folder was
+    # deleted since.
+    fname = os.fspath(fname)
+    file_name = os.path.basename(fname)
+    parent = os.path.dirname(fname)
+    if parent not in _CREATED_DIRS or not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+        _CREATED_DIRS.add(parent)
     download_attempts = 1 + retry_if_failed
     max_wait = 10
     for i in range(download_attempts):
         try:
-            # Stream the file to a temporary so that we can safely check its
-            # hash before overwriting the original.
-            with temporary_file(path=str(fname.parent)) as tmp:
-                downloader(url, tmp, pooch)
-                hash_matches(tmp, known_hash, strict=True, source=str(fname.name))
-                shutil.move(tmp, str(fname))
+            if known_hash is not None and getattr(
+                downloader, "supports_hashers", False
+            ):
+                # The downloader can hash while downloading straight into a
+                # ".part" partial next to the destination, which lets an
+                # interrupted large download resume instead of starting
+                # over (including between retry attempts).
+                _download_resumable(
+                    url, fname, known_hash, downloader, pooch, file_name
+                )
+            else:
+                # Stream the file to a temporary so that we can safely
+                # check its hash before overwriting the original.
+                with temporary_file(path=parent) as tmp:
+                    _download_verified(
+                        url, tmp, known_hash, downloader, pooch, file_name
+                    )
+                    # The temporary file normally lives in the same
+                    # directory as the destination, so an atomic rename is
+                    # enough (and cheaper than a copy-based move).
+                    # Symlinked or otherwise redirected cache folders can
+                    # still land on another filesystem, in which case fall
+                    # back to a copying move (which uses sendfile/copyfile
+                    # where the OS provides them).
+                    try:
+                        os.replace(tmp, fname)
+                    except OSError:
+                        shutil.move(tmp, fname)
+                    # HTTPDownloader records the server's ETag in a sidecar
+                    # file next to its target, which here is the temporary
+                    # file. Key the sidecar to the final name so it can be
+                    # found by later downloads instead of being left behind
+                    # as litter. A previous sidecar no longer describes the
+                    # file after this download, so remove it if there's no
+                    # replacement.
+                    if os.path.exists(tmp + ".etag"):
+                        os.replace(tmp + ".etag", fname + ".etag")
+                    elif os.path.exists(fname + ".etag"):
+                        os.remove(fname + ".etag")
+            if known_hash is not None:
+                # The sidecar record lets later fetches detect a size change
+                # with a single stat() and, when POOCH_TRUST_MTIME is set,
+                # skip re-hashing unchanged files entirely.
+                _write_verified_sidecar(fname, known_hash)
             break
-        except (ValueError, requests.exceptions.RequestException):
+        except requests.exceptions.RequestException as error:
             if i == download_attempts - 1:
                 raise
+            # Client errors (4xx) aren't transient so retrying won't help.
+            if (
+                isinstance(error, requests.exceptions.HTTPError)
+                and error.response is not None
+                and 400 <= error.response.status_code < 500
+            ):
+                raise
             retries_left = download_attempts - (i + 1)
-            get_logger().info(
+            _LOGGER.info(
                 "Failed to download '%s'. "
                 "Will attempt the download again %d more time%s.",
-                str(fname.name),
+                file_name,
                 retries_left,
                 "s" if retries_left > 1 else "",
             )
-            time.sleep(min(i + 1, max_wait))
+            # Exponential backoff with random jitter so parallel workers
+            # retrying at the same time don't hammer the server in lockstep.
+            time.sleep(min(2**i + random.uniform(0, 1), max_wait))
+        except HashMismatchError:
+            # A hash mismatch is almost never fixed by downloading again: it
+            # usually means the upstream file or the registry entry is wrong.
+            # Retry once in case the data was corrupted in transit, then give
+            # up instead of wasting bandwidth on more doomed downloads.
+            if i > 0 or download_attempts == 1:
+                raise
+            _LOGGER.info(
+                "Hash of downloaded file '%s' doesn't match the known hash. "
+                "Will attempt the download once more in case the file was "
+                "corrupted in transit.",
+                file_name,
+            )
@@ -9,10 +9,19 @@ The classes that actually handle the downloads.
 """
 import os
 import sys
+import time
 import ftplib
+import socket
+import shutil
+import asyncio
+import functools
+import threading
+import concurrent.futures
 
 import warnings
+from urllib.parse import urlsplit
 
+from .hashes import HashingFile
 from .utils import parse_url
 
 try:
@@ -25,12 +34,172 @@ try:
 except ImportError:
     paramiko = None
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # orjson parses large API responses several times faster than the
+    # standard library
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 
 # Set the default timeout in seconds so it can be configured in a pinch for the
 # methods that don't or can't expose a way set it at runtime.
 # See https://github.com/fatiando/pooch/issues/409
 DEFAULT_TIMEOUT = 30
 
+# tqdm progress bars need to use ascii characters on Windows because there
+# isn't always full unicode support
+# (see https://github.com/tqdm/tqdm/issues/454)
+_USE_ASCII_PROGRESS = bool(sys.platform == "win32")
+
+
+def _progress_bar(total, resume_from=0):
+    "Build the default tqdm progress bar for a download of *total* bytes."
+    return tqdm(
+        total=total,
+        initial=resume_from,
+        ncols=79,
+        ascii=_USE_ASCII_PROGRESS,
+        unit="B",
+        unit_scale=True,
+        leave=True,
+    )
+
+
+def _preallocate(output_file, total):
+    """
+    Reserve the disk space for a download of *total* bytes up front.
+
+    Preallocating keeps large downloads from fragmenting as they are
+    written chunk by chunk. A no-op for small files and when the platform
+    or the file object doesn't support it.
+    """
+    if total > 2**20 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(output_file.fileno(), 0, total)
+        except (OSError, AttributeError):
+            # Not a real file (e.g., BytesIO) or the filesystem doesn't
+            # support it. Not a problem.
+            pass
+
+
+# Sent with data repository API requests. Asking explicitly for JSON lets us
+# parse the raw response bytes without going through the (slow) text encoding
+# detection in requests.
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# Cache of FTP directory listings used by availability checks:
+# (host, port, directory) -> (timestamp, frozenset of file names). Listings
+# can have thousands of entries so fetching them repeatedly when checking
+# many files in the same directory is wasteful. Entries expire after a short
+# time in case the server contents change.
+_NLST_CACHE = {}
+_NLST_CACHE_TTL = 60
+
+# Shared requests.Session created on first use (see _get_session). Reusing a
+# session keeps HTTP connections alive between requests, amortizing the
+# TCP/TLS handshakes when downloading many files from the same servers.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Get the shared :class:`requests.Session` used for HTTP(S) requests.
+
+    The session is created lazily on first use (so importing pooch doesn't
+    import requests) and configured with a pooled connection adapter and
+    automatic retries for transient server errors.
+    """
+    global _SESSION  # pylint: disable=global-statement
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                # Lazy import requests to speed up import time
+                import requests  # pylint: disable=C0415
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=requests.adapters.Retry(
+                        total=5,
+                        connect=3,
+                        read=3,
+                        status=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(["GET", "HEAD"]),
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                try:
+                    # Advertise brotli on top of the requests defaults. The
+                    # JSON returned by data repository APIs is highly
+                    # compressible so this cuts the metadata transfer size.
+                    import brotli  # pylint: disable=C0415,unused-import
+
+                    session.headers["Accept-Encoding"] = "br, gzip, deflate"
+                except ImportError:
+                    pass
+                _SESSION = session
+    return _SESSION
+
+
+def _cached_nlst(ftp, host, port, directory):
+    """
+    List an FTP directory, caching the result for repeated checks.
+
+    Returns a frozenset of the names in the directory. Cached entries are
+    reused for up to ``_NLST_CACHE_TTL`` seconds.
+    """
+    key = (host, port, directory)
+    cached = _NLST_CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _NLST_CACHE_TTL:
+        return cached[1]
+    listing = frozenset(ftp.nlst(directory))
+    _NLST_CACHE[key] = (now, listing)
+    return listing
+
+
+def _read_etag(path):
+    """
+    Read the ETag saved for a downloaded file, if there is one.
+
+    The ETag is stored in a small sidecar file next to the download so that
+    later requests can be made conditional (``If-None-Match``). Returns None
+    if no ETag was recorded.
+    """
+    try:
+        with open(path + ".etag", encoding="utf-8") as etag_file:
+            etag = etag_file.read().strip()
+    except OSError:
+        return None
+    return etag or None
+
+
+def _write_etag(path, etag):
+    """
+    Save the ETag the server sent for a downloaded file in a sidecar file.
+
+    Failures to write the sidecar are ignored since it's only an
+    optimization for future downloads.
+    """
+    if not etag:
+        return
+    try:
+        with open(path + ".etag", "w", encoding="utf-8") as etag_file:
+            etag_file.write(etag)
+    except OSError:
+        pass
+
 
 def choose_downloader(url, progressbar=False):
     """
@@ -69,25 +238,30 @@ def choose_downloader(url, progressbar=False):
     DOIDownloader
 
     """
-    known_downloaders = {
-        "ftp": FTPDownloader,
-        "https": HTTPDownloader,
-        "http": HTTPDownloader,
-        "sftp": SFTPDownloader,
-        "doi": DOIDownloader,
-    }
-
-    parsed_url = parse_url(url)
-    if parsed_url["protocol"] not in known_downloaders:
+    # Only the scheme matters for the dispatch, so skip the full URL parse
+    # when there's an explicit "://" separator. DOI URLs don't have one
+    # (except the invalid "doi://" form) and go through parse_url, which
+    # also validates them.
+    if "://" in url and not url.startswith("doi:"):
+        protocol = url.split("://", 1)[0].lower()
+    else:
+        protocol = parse_url(url)["protocol"]
+    if protocol not in _KNOWN_DOWNLOADERS:
         raise ValueError(
-            f"Unrecognized URL protocol '{parsed_url['protocol']}' in '{url}'. "
-            f"Must be one of {known_downloaders.keys()}."
+            f"Unrecognized URL protocol '{protocol}' in '{url}'. "
+            f"Must be one of {_KNOWN_DOWNLOADERS.keys()}."
         )
-    downloader = known_downloaders[parsed_url["protocol"]](progressbar=progressbar)
-    return downloader
+    if not progressbar:
+        # Downloader instances don't keep per-download state, so the default
+        # ones are created once and shared between calls instead of being
+        # rebuilt for every file in a registry.
+        if protocol not in _DEFAULT_DOWNLOADERS:
+            _DEFAULT_DOWNLOADERS[protocol] = _KNOWN_DOWNLOADERS[protocol]()
+        return _DEFAULT_DOWNLOADERS[protocol]
+    return _KNOWN_DOWNLOADERS[protocol](progressbar=progressbar)
 
 
-class HTTPDownloader:  # pylint: disable=too-few-public-methods
+class HTTPDownloader:
     """
     Download manager for fetching files over HTTP/HTTPS.
 
@@ -105,9 +279,29 @@ class HTTPDownloader:  # pylint: disable=too-few-public-methods
         (stderr). Requires `tqdm <https://github.com/tqdm/tqdm>`__ to be
         installed. Alternatively, an arbitrary progress bar object can be
         passed. See :ref:`custom-progressbar` for details.
-    chunk_size : int
+    chunk_size : int or None
         Files are streamed *chunk_size* bytes at a time instead of loading
         everything into memory at one. Usually doesn't need to be changed.
+        If None, the default of 64 KiB is used.
+    session : None or :class:`requests.Session`
+        The session used to make the requests. If None (default), a session
+        shared by all downloaders is used so that connections are kept alive
+        between downloads from the same server.
+    pool_connections : None or int
+        Number of connection pools (one per host) kept by the session. If
+        given (and *session* is None), a dedicated session is built for this
+        downloader instead of the shared one.
+    pool_maxsize : None or int
+        Maximum number of pooled connections per host. Set this to at least
+        the number of worker threads when driving the downloader from a
+        thread pool (e.g. :meth:`download_many`), otherwise extra
+        connections are discarded instead of being kept alive.
+    parallel_parts : int
+        If larger than 1, download the file in this many byte-range parts
+        concurrently (when the server supports range requests and the
+        download goes to a file path). Can speed up large downloads on
+        links where a single connection doesn't fill the available
+        bandwidth.
     **kwargs
         All keyword arguments given when creating an instance of this class
         will be passed to :func:`requests.get`.
@@ -164,16 +358,67 @@ class HTTPDownloader:  # pylint: disable=too-few-public-methods
 
     """
 
-    def __init__(self, progressbar=False, chunk_size=1024, **kwargs):
+    # Can write to open file objects, so the hash can be computed while the
+    # download is being streamed to disk (see pooch.core.stream_download).
+    supports_file_objects = True
+    # Can also stream into a ".part" partial file while feeding the bytes
+    # through a caller-provided hasher, letting interrupted downloads resume
+    # with the hash still computed on the fly (see pooch.core.stream_download).
+    supports_hashers = True
+
+    def __init__(
+        self,
+        progressbar=False,
+        chunk_size=65536,
+        session=None,
+        pool_connections=None,
+        pool_maxsize=None,
+        parallel_parts=1,
+        **kwargs,
+    ):
         self.kwargs = kwargs
         self.progressbar = progressbar
         self.chunk_size = chunk_size
+        self.session = session
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.parallel_parts = parallel_parts
         if self.progressbar is True and tqdm is None:
             raise ValueError("Missing package 'tqdm' required for progress bars.")
+        # Normalize the arguments for session.get once instead of copying
+        # and patching the dict on every call.
+        self._get_kwargs = {"stream": True, **kwargs}
+        self._timeout = self._get_kwargs.pop("timeout", DEFAULT_TIMEOUT)
+        headers = dict(self._get_kwargs.pop("headers", None) or {})
+        # Ask for the file as-is instead of letting the server pick a
+        # transfer compression. Data files rarely compress well and this
+        # keeps content-length equal to the bytes actually streamed, so
+        # progress totals and resume offsets are exact.
+        headers.setdefault("Accept-Encoding", "identity")
+        self._get_kwargs["headers"] = headers
+
+    def _get_session(self):
+        "Get the session for this downloader, building one if needed."
+        if self.session is None:
+            if self.pool_connections is None and self.pool_maxsize is None:
+                return _get_session()
+            # Custom pool sizes get a dedicated session, built once and kept
+            # for the lifetime of the downloader.
+            # Lazy import requests to speed up import time
+            import requests  # pylint: disable=C0415
+
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.pool_connections or 10,
+                pool_maxsize=self.pool_maxsize or 50,
+                max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self.session = session
+        return self.session
 
-    def __call__(
-        self, url, output_file, pooch, check_only=False
-    ):  # pylint: disable=R0914
+    def __call__(self, url, output_file, pooch, check_only=False, hasher=None):
         """
         Download the given URL over HTTP to the given output file.
 
@@ -191,6 +436,12 @@ class HTTPDownloader:  # pylint: disable=too-few-public-methods
             If True, will only check if a file exists on the server and
             **without downloading the file**. Will return ``True`` if the file
             exists and ``False`` otherwise.
+        hasher : None or hasher object
+            If given (only valid when *output_file* is a path), the
+            downloaded bytes are fed through this hasher and the download is
+            left in a ".part" partial file next to *output_file* for the
+            caller to verify and move into place. Used by
+            :func:`pooch.core.stream_download`.
 
         Returns
         -------
@@ -199,66 +450,301 @@ class HTTPDownloader:  # pylint: disable=too-few-public-methods
             is available on the server. Otherwise, returns ``None``.
 
         """
-        # Lazy import requests to speed up import time
-        import requests  # pylint: disable=C0415
+        session = self._get_session()
 
         if check_only:
-            timeout = self.kwargs.get("timeout", DEFAULT_TIMEOUT)
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
+            response = session.head(url, timeout=self._timeout, allow_redirects=True)
             available = bool(response.status_code == 200)
             return available
 
-        kwargs = self.kwargs.copy()
-        timeout = kwargs.pop("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("stream", True)
-        ispath = not hasattr(output_file, "write")
-        if ispath:
-            # pylint: disable=consider-using-with
-            output_file = open(output_file, "w+b")
-            # pylint: enable=consider-using-with
-        try:
-            response = requests.get(url, timeout=timeout, **kwargs)
+        if hasattr(output_file, "write"):
+            response = session.get(url, timeout=self._timeout, **self._get_kwargs)
             response.raise_for_status()
-            content = response.iter_content(chunk_size=self.chunk_size)
             total = int(response.headers.get("content-length", 0))
-            if self.progressbar is True:
-                # Need to use ascii characters on Windows because there isn't
-                # always full unicode support
-                # (see https://github.com/tqdm/tqdm/issues/454)
-                use_ascii = bool(sys.platform == "win32")
-                progress = tqdm(
-                    total=total,
-                    ncols=79,
-                    ascii=use_ascii,
-                    unit="B",
-                    unit_scale=True,
-                    leave=True,
-                )
-            elif self.progressbar:
-                progress = self.progressbar
-                progress.total = total
-            for chunk in content:
-                if chunk:
-                    output_file.write(chunk)
-                    output_file.flush()
-                    if self.progressbar:
-                        # Use the chunk size here because chunk may be much
-                        # larger if the data are decompressed by requests after
-                        # reading (happens with text files).
-                        progress.update(self.chunk_size)
-            # Make sure the progress bar gets filled even if the actual number
-            # is chunks is smaller than expected. This happens when streaming
-            # text files that are compressed by the server when sending (gzip).
-            # Binary files don't experience this.
-            if self.progressbar:
-                progress.reset()
-                progress.update(total)
-                progress.close()
-        finally:
-            if ispath:
-                output_file.close()
+            self._write_body(response, output_file, total)
+        else:
+            self._download_to_path(session, url, str(output_file), hasher)
         return None
 
+    def _download_to_path(self, session, url, target_path, hasher=None):
+        """
+        Download the URL to a file path.
+
+        The file is downloaded to a ".part" partial next to *target_path*
+        and moved into place on success, so an interrupted download never
+        leaves a truncated file at the final path. An existing partial is
+        resumed with a range request, the server's ETag is saved in a
+        sidecar file, and large files are fetched in parallel byte-range
+        parts when configured (see :meth:`_download_parallel`).
+
+        If *hasher* is given, all downloaded bytes (including any resumed
+        from a previous partial) are fed through it and the partial is left
+        in place for the caller to verify and rename, with the ETag sidecar
+        keyed to the partial name so it can follow the file.
+        """
+        tmp_path = target_path + ".part"
+        # If a partial file was left behind by an interrupted download, ask
+        # the server for only the bytes we're missing.
+        resume_from = os.path.getsize(tmp_path) if os.path.exists(tmp_path) else 0
+        if (
+            self.parallel_parts > 1
+            and not resume_from
+            and hasher is None
+            and hasattr(os, "pwrite")
+        ):
+            response = self._download_parallel(
+                session, url, tmp_path, self._timeout, self._get_kwargs
+            )
+            if response is not None:
+                os.replace(tmp_path, target_path)
+                _write_etag(target_path, response.headers.get("ETag"))
+                return
+            # The server doesn't support range requests. Fall through to
+            # the regular sequential download.
+        kwargs = self._request_kwargs(target_path, resume_from, hasher is None)
+        # pylint: disable=consider-using-with
+        # A large write buffer coalesces the incoming chunks into fewer,
+        # bigger write syscalls.
+        if resume_from:
+            output_file = open(tmp_path, "r+b", buffering=2**20)
+            output_file.seek(resume_from)
+        else:
+            output_file = open(tmp_path, "wb", buffering=2**20)
+        # pylint: enable=consider-using-with
+        # On failure the partial file is kept around so the next attempt can
+        # resume from where this one stopped instead of starting over.
+        try:
+            response = session.get(url, timeout=self._timeout, **kwargs)
+            response.raise_for_status()
+            if response.status_code == 304:
+                # The file on disk still matches the ETag we sent, so the
+                # server replied without a body. Keep the existing file.
+                output_file.close()
+                os.remove(tmp_path)
+                return
+            if resume_from and response.status_code != 206:
+                # The server ignored the range request and sent the whole
+                # file. Start writing from scratch.
+                output_file.seek(0)
+                output_file.truncate()
+                resume_from = 0
+            if hasher is not None:
+                if resume_from:
+                    # The hash must also cover the bytes downloaded by the
+                    # interrupted attempt we're picking up from.
+                    self._hash_partial(output_file, hasher, resume_from)
+                output_file = HashingFile(output_file, hasher)
+            # When resuming, content-length only counts the missing bytes
+            # but the full size of the file is what matters below.
+            total = int(response.headers.get("content-length", 0)) + resume_from
+            self._write_body(response, output_file, total, resume_from)
+        finally:
+            output_file.close()
+        if hasher is not None:
+            # Leave the partial in place: the caller checks the digest and
+            # only then moves it (and the ETag sidecar) into place.
+            _write_etag(tmp_path, response.headers.get("ETag"))
+            return
+        os.replace(tmp_path, target_path)
+        _write_etag(target_path, response.headers.get("ETag"))
+
+    @staticmethod
+    def _hash_partial(output_file, hasher, nbytes):
+        """
+        Feed the first *nbytes* already in the open file through the hasher.
+
+        Used when resuming, since the bytes saved by the interrupted
+        download must be hashed as well. Leaves the file positioned at
+        *nbytes*, ready for the remainder to be appended.
+        """
+        output_file.seek(0)
+        remaining = nbytes
+        while remaining > 0:
+            chunk = output_file.read(min(2**20, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+
+    def _request_kwargs(self, target_path, resume_from, conditional=True):
+        """
+        Per-download keyword arguments for the session.get call.
+
+        Returns the precomputed arguments, adding a Range header when
+        resuming a partial download or an If-None-Match header when a saved
+        ETag allows a conditional request. *conditional* is False when the
+        caller needs the data hashed, since a 304 reply carries no body to
+        hash. The shared dict is never modified: per-download headers go
+        into a copy.
+        """
+        kwargs = self._get_kwargs
+        if resume_from:
+            headers = {**kwargs["headers"], "Range": f"bytes={resume_from}-"}
+            return {**kwargs, "headers": headers}
+        if conditional and os.path.exists(target_path):
+            # If we saved the server's ETag from a previous download of
+            # this file, make the request conditional so the server can
+            # answer 304 Not Modified without sending the payload again.
+            etag = _read_etag(target_path)
+            if etag is not None:
+                headers = {**kwargs["headers"], "If-None-Match": etag}
+                return {**kwargs, "headers": headers}
+        return kwargs
+
+    def _write_body(self, response, output_file, total, resume_from=0):
+        """
+        Stream the body of the response into the open output file.
+
+        Preallocates the disk space for large files when possible. *total*
+        is the full size of the file, including any already downloaded bytes
+        being resumed.
+        """
+        _preallocate(output_file, total)
+        if self.progressbar:
+            self._stream_with_progress(response, output_file, total, resume_from)
+        elif 0 < total < 2**20:
+            # Small files (the typical pooch registry entry) are read in a
+            # single operation instead of streaming through the chunk loop.
+            output_file.write(response.content)
+        else:
+            # Without a progress bar there is no need to see individual
+            # chunks, so copy from urllib3's buffer straight into the file,
+            # skipping the per-chunk Python overhead of iter_content. Decode
+            # the transfer encoding (gzip etc) so the result matches what
+            # iter_content would produce.
+            response.raw.decode_content = True
+            shutil.copyfileobj(
+                response.raw, output_file, length=self.chunk_size or 2**16
+            )
+
+    def _stream_with_progress(self, response, output_file, total, resume_from):
+        "Stream the response body while keeping a progress bar up to date."
+        if self.progressbar is True:
+            progress = _progress_bar(total, resume_from)
+        else:
+            progress = self.progressbar
+            progress.total = total
+        # Bind the methods to local names to avoid repeated attribute
+        # lookups in the loop. Downloads with small chunks can go through
+        # this loop hundreds of thousands of times.
+        write = output_file.write
+        update = progress.update
+        raw = response.raw
+        # Decode the transfer encoding (if any) so the result matches what
+        # iter_content would produce
+        raw.decode_content = True
+        # Read into a single reusable buffer instead of letting
+        # iter_content allocate a fresh bytes object per chunk
+        buffer = bytearray(self.chunk_size or 2**16)
+        view = memoryview(buffer)
+        # Batch the progress updates so tqdm isn't poked for every single
+        # chunk. With small chunk sizes the bar bookkeeping can otherwise
+        # dominate the download loop.
+        threshold = max(len(buffer), total // 1000)
+        pending = 0
+        while True:
+            nbytes = raw.readinto(buffer)
+            if not nbytes:
+                break
+            write(view[:nbytes])
+            pending += nbytes
+            if pending >= threshold:
+                update(pending)
+                pending = 0
+        if pending:
+            update(pending)
+        progress.close()
+
+    def download_many(self, jobs, pooch=None, max_workers=8):
+        """
+        Download several URLs concurrently with a pool of threads.
+
+        Downloads are I/O bound and independent, so downloading many small
+        files concurrently is much faster than one at a time. All threads
+        share the same keep-alive session (sessions are thread-safe for
+        GET requests).
+
+        Parameters
+        ----------
+        jobs : list
+            List of ``(url, output_file)`` tuples, one for each file, with
+            the same meaning as the arguments of the downloader call.
+        pooch : :class:`~pooch.Pooch`
+            The instance of :class:`~pooch.Pooch` that is calling this
+            method (or None).
+        max_workers : int
+            Maximum number of concurrent downloads. Keep moderate to avoid
+            overwhelming a single host.
+
+        """
+        if not jobs:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(jobs))
+        ) as executor:
+            futures = [
+                executor.submit(self, url, output_file, pooch)
+                for url, output_file in jobs
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                # Propagate any download errors
+                future.result()
+
+    def _download_parallel(self, session, url, path, timeout, kwargs):
+        """
+        Download the URL in byte-range parts fetched by a pool of threads.
+
+        Each worker requests one range and writes it at the right position
+        in the output file with :func:`os.pwrite`. Returns the HEAD
+        response used to size the parts, or None if the server doesn't
+        support range requests (the caller then falls back to the regular
+        sequential download).
+        """
+        head_kwargs = {key: value for key, value in kwargs.items() if key != "stream"}
+        head = session.head(url, timeout=timeout, allow_redirects=True, **head_kwargs)
+        head.raise_for_status()
+        total = int(head.headers.get("content-length", 0))
+        if not total or head.headers.get("accept-ranges", "").lower() != "bytes":
+            return None
+        # Ceiling division so the last part covers any remainder
+        part = -(-total // self.parallel_parts)
+
+        def fetch_range(fileno, start):
+            "Download bytes [start, start + part) into the output file"
+            stop = min(start + part, total) - 1
+            range_kwargs = dict(kwargs)
+            headers = dict(range_kwargs.pop("headers", None) or {})
+            headers["Range"] = f"bytes={start}-{stop}"
+            range_kwargs["headers"] = headers
+            range_kwargs.setdefault("stream", True)
+            response = session.get(url, timeout=timeout, **range_kwargs)
+            response.raise_for_status()
+            position = start
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    os.pwrite(fileno, chunk, position)
+                    position += len(chunk)
+
+        try:
+            with open(path, "wb") as output_file:
+                output_file.truncate(total)
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.parallel_parts
+                ) as executor:
+                    futures = [
+                        executor.submit(fetch_range, output_file.fileno(), start)
+                        for start in range(0, total, part)
+                    ]
+                    for future in futures:
+                        future.result()
+        except Exception:
+            # A partially written sparse file can't be resumed by the
+            # sequential path, so don't leave it behind.
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        return head
+
 
 class FTPDownloader:  # pylint: disable=too-few-public-methods
     """
@@ -294,9 +780,24 @@ class FTPDownloader:  # pylint: disable=too-few-public-methods
     chunk_size : int
         Files are streamed *chunk_size* bytes at a time instead of loading
         everything into memory at one. Usually doesn't need to be changed.
+    parallel : int
+        If larger than 1, download the file in this many byte-range segments
+        concurrently, each over its own FTP connection. Only used when
+        downloading to a file path (not an open file object). Can speed up
+        large downloads on links where a single FTP stream doesn't fill the
+        available bandwidth.
+    recv_buffer_size : None or int
+        Size in bytes of the kernel receive buffer (``SO_RCVBUF``) for the
+        data connections. If None (default), the operating system default
+        is used. Raising it (e.g. to 4 MiB) can help on high-latency,
+        high-bandwidth links.
 
     """
 
+    # Can write to open file objects, so the hash can be computed while the
+    # download is being streamed to disk (see pooch.core.stream_download).
+    supports_file_objects = True
+
     def __init__(
         self,
         port=21,
@@ -305,7 +806,9 @@ class FTPDownloader:  # pylint: disable=too-few-public-methods
         account="",
         timeout=None,
         progressbar=False,
-        chunk_size=1024,
+        chunk_size=65536,
+        parallel=1,
+        recv_buffer_size=None,
     ):
         self.port = port
         self.username = username
@@ -314,9 +817,18 @@ class FTPDownloader:  # pylint: disable=too-few-public-methods
         self.timeout = timeout
         self.progressbar = progressbar
         self.chunk_size = chunk_size
+        self.parallel = parallel
+        self.recv_buffer_size = recv_buffer_size
         if self.progressbar is True and tqdm is None:
             raise ValueError("Missing package 'tqdm' required for progress bars.")
 
+    def _tune_socket(self, conn):
+        "Apply the receive buffer size to a data connection, if configured."
+        if self.recv_buffer_size:
+            conn.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.recv_buffer_size
+            )
+
     def __call__(self, url, output_file, pooch, check_only=False):
         """
         Download the given URL over FTP to the given output file.
@@ -349,7 +861,10 @@ class FTPDownloader:  # pylint: disable=too-few-public-methods
             directory, file_name = os.path.split(parsed_url["path"])
             try:
                 ftp.login(user=self.username, passwd=self.password, acct=self.account)
-                available = file_name in ftp.nlst(directory)
+                listing = _cached_nlst(
+                    ftp, parsed_url["netloc"], self.port, directory
+                )
+                available = file_name in listing
             finally:
                 ftp.close()
             return available
@@ -357,42 +872,249 @@ class FTPDownloader:  # pylint: disable=too-few-public-methods
         ispath = not hasattr(output_file, "write")
         if ispath:
             # pylint: disable=consider-using-with
-            output_file = open(output_file, "w+b")
+            # A large write buffer coalesces the incoming blocks into fewer,
+            # bigger write syscalls.
+            output_file = open(output_file, "w+b", buffering=2**20)
             # pylint: enable=consider-using-with
         try:
             ftp.login(user=self.username, passwd=self.password, acct=self.account)
-            command = f"RETR {parsed_url['path']}"
-            if self.progressbar:
-                # Make sure the file is set to binary mode, otherwise we can't
-                # get the file size. See: https://stackoverflow.com/a/22093848
-                ftp.voidcmd("TYPE I")
-                use_ascii = bool(sys.platform == "win32")
-                progress = tqdm(
-                    total=int(ftp.size(parsed_url["path"])),
-                    ncols=79,
-                    ascii=use_ascii,
-                    unit="B",
-                    unit_scale=True,
-                    leave=True,
-                )
-                with progress:
-
-                    def callback(data):
-                        "Update the progress bar and write to output"
-                        progress.update(len(data))
-                        output_file.write(data)
-
-                    ftp.retrbinary(command, callback, blocksize=self.chunk_size)
+            if self.parallel > 1 and ispath:
+                self._download_segmented(ftp, parsed_url, output_file)
             else:
-                ftp.retrbinary(command, output_file.write, blocksize=self.chunk_size)
+                self._download_stream(ftp, parsed_url, output_file)
         finally:
             ftp.quit()
             if ispath:
                 output_file.close()
         return None
 
+    def _download_segmented(self, ftp, parsed_url, output_file):
+        """
+        Download the file in parallel byte-range segments.
+
+        Uses the given control connection to query the file size and drives
+        the shared progress bar, if any (see :meth:`_download_parallel`).
+        """
+        # Binary mode is needed to get the file size
+        ftp.voidcmd("TYPE I")
+        total = int(ftp.size(parsed_url["path"]))
+        progress = _progress_bar(total) if self.progressbar else None
+        try:
+            self._download_parallel(
+                parsed_url["netloc"],
+                parsed_url["path"],
+                output_file,
+                total,
+                progress,
+            )
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def _download_stream(self, ftp, parsed_url, output_file):
+        """
+        Download the file over a single data connection.
+
+        The transfer loop itself is in :meth:`_retrieve`.
+        """
+        # Binary mode is needed to get the file size and for the transfer.
+        # See: https://stackoverflow.com/a/22093848
+        ftp.voidcmd("TYPE I")
+        try:
+            total = int(ftp.size(parsed_url["path"]))
+        except ftplib.all_errors:
+            # Not all servers implement SIZE. It's only used for the
+            # progress bar and preallocation anyway.
+            total = 0
+        command = f"RETR {parsed_url['path']}"
+        if self.progressbar:
+            with _progress_bar(total) as progress:
+                self._retrieve(ftp, command, output_file, total, progress)
+        else:
+            self._retrieve(ftp, command, output_file, total)
+
+    def _retrieve(self, ftp, command, output_file, total=0, progress=None):
+        """
+        Stream the RETR response straight from the data socket.
+
+        Receives into a reusable buffer with ``recv_into`` instead of going
+        through :meth:`ftplib.FTP.retrbinary`, which allocates a new bytes
+        object and dispatches a Python callback for every block. Progress
+        updates (if any) are batched as in :class:`HTTPDownloader`. The
+        connection must already be in binary mode (``TYPE I``).
+        """
+        _preallocate(output_file, total)
+        write = output_file.write
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        if progress is not None:
+            threshold = max(self.chunk_size, total // 1000)
+        pending = 0
+        conn = ftp.transfercmd(command)
+        self._tune_socket(conn)
+        try:
+            while True:
+                nbytes = conn.recv_into(view)
+                if not nbytes:
+                    break
+                write(view[:nbytes])
+                if progress is not None:
+                    pending += nbytes
+                    if pending >= threshold:
+                        progress.update(pending)
+                        pending = 0
+        finally:
+            conn.close()
+        if progress is not None and pending:
+            progress.update(pending)
+        ftp.voidresp()
 
-class SFTPDownloader:  # pylint: disable=too-few-public-methods
+    def _download_parallel(self, host, path, output_file, total, progress=None):
+        """
+        Download a file in byte-range segments over separate FTP connections.
+
+        Each worker thread opens its own connection, restarts the transfer
+        at its segment offset (``REST``), and writes the received bytes
+        directly at the right position in the output file with
+        :func:`os.pwrite`. The file is grown to its final size up front.
+        """
+        fileno = output_file.fileno()
+        os.ftruncate(fileno, total)
+        # Ceiling division so the last segment covers any remainder
+        segment = -(-total // self.parallel)
+
+        def fetch_segment(offset):
+            "Download bytes [offset, offset + segment) of the remote file"
+            remaining = min(offset + segment, total) - offset
+            ftp = ftplib.FTP(timeout=self.timeout)
+            try:
+                ftp.connect(host=host, port=self.port)
+                ftp.login(
+                    user=self.username, passwd=self.password, acct=self.account
+                )
+                ftp.voidcmd("TYPE I")
+                conn = ftp.transfercmd(f"RETR {path}", rest=offset)
+                self._tune_socket(conn)
+                try:
+                    position = offset
+                    while remaining > 0:
+                        data = conn.recv(min(self.chunk_size, remaining))
+                        if not data:
+                            raise ftplib.Error(
+                                f"Connection closed before finishing '{path}' "
+                                f"at byte {position} of {total}."
+                            )
+                        os.pwrite(fileno, data, position)
+                        position += len(data)
+                        remaining -= len(data)
+                        if progress is not None:
+                            progress.update(len(data))
+                finally:
+                    conn.close()
+                # We close the data connection as soon as our segment is
+                # complete, so the server may report the transfer as
+                # aborted. That's expected and not a failure.
+                try:
+                    ftp.voidresp()
+                except ftplib.all_errors:
+                    pass
+            finally:
+                ftp.close()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.parallel
+        ) as executor:
+            futures = [
+                executor.submit(fetch_segment, offset)
+                for offset in range(0, total, segment)
+            ]
+            for future in futures:
+                future.result()
+
+
+class AsyncHTTPDownloader:  # pylint: disable=too-few-public-methods
+    """
+    Download manager for fetching many files over HTTP/HTTPS with asyncio.
+
+    Downloads a batch of URLs concurrently on a single thread using
+    `aiohttp <https://docs.aiohttp.org/>`__, which has lower per-connection
+    overhead than a thread pool. Best suited for registries with hundreds of
+    small files. Requires `aiohttp` to be installed.
+
+    Unlike the other downloaders, this one is called with a batch of files
+    through :meth:`download_many` instead of one file at a time.
+
+    Parameters
+    ----------
+    chunk_size : int
+        Files are streamed *chunk_size* bytes at a time instead of loading
+        everything into memory at one. Usually doesn't need to be changed.
+    max_concurrent : int
+        Maximum number of downloads in flight at the same time. Keep
+        moderate to avoid overwhelming a single host.
+    **kwargs
+        All keyword arguments given when creating an instance of this class
+        will be passed to :meth:`aiohttp.ClientSession.get`.
+
+    """
+
+    def __init__(self, chunk_size=65536, max_concurrent=5, **kwargs):
+        self.kwargs = kwargs
+        self.chunk_size = chunk_size
+        self.max_concurrent = max_concurrent
+        if aiohttp is None:
+            raise ValueError(
+                "Missing package 'aiohttp' required for asynchronous downloads."
+            )
+
+    async def _fetch(self, session, semaphore, url, output_file):
+        "Download a single URL to the given path."
+        async with semaphore:
+            async with session.get(url, **self.kwargs) as response:
+                response.raise_for_status()
+                with open(output_file, "wb") as fout:
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
+                        fout.write(chunk)
+
+    async def _fetch_all(self, jobs):
+        "Download all jobs concurrently through one connection pool."
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent, keepalive_timeout=30
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(
+                *(
+                    self._fetch(session, semaphore, url, output_file)
+                    for url, output_file in jobs
+                )
+            )
+
+    def download_many(self, jobs):
+        """
+        Download several URLs concurrently through the asyncio event loop.
+
+        Parameters
+        ----------
+        jobs : list
+            List of ``(url, output_file)`` tuples, one for each file. The
+            output files must be paths, not open file objects.
+
+        """
+        if not jobs:
+            return
+        asyncio.run(self._fetch_all(jobs))
+
+
+# Pooled SFTP connections, keyed by (host, port, username). SSH key exchange
+# and authentication take hundreds of milliseconds, so connections are kept
+# open and reused between downloads from the same server (see
+# SFTPDownloader.close_all).
+_SFTP_POOL = {}
+_SFTP_POOL_LOCK = threading.Lock()
+
+
+class SFTPDownloader:
     """
     Download manager for fetching files over SFTP.
 
@@ -400,6 +1122,10 @@ class SFTPDownloader:  # pylint: disable=too-few-public-methods
     Requires `paramiko <https://github.com/paramiko/paramiko>`__ to be
     installed.
 
+    Connections are pooled and reused between downloads from the same server
+    so that the SSH handshake only happens once per server. Use
+    :meth:`close_all` to close the pooled connections.
+
     Use with :meth:`pooch.Pooch.fetch` or :func:`pooch.retrieve` to customize
     the download of files (for example, to use authentication or print a
     progress bar).
@@ -469,38 +1195,80 @@ class SFTPDownloader:  # pylint: disable=too-few-public-methods
             The instance of :class:`~pooch.Pooch` that is calling this method.
         """
         parsed_url = parse_url(url)
-        connection = paramiko.Transport(sock=(parsed_url["netloc"], self.port))
-        sftp = None
-        try:
+        sftp = self._get_connection(parsed_url["netloc"])
+        sftp.get_channel().settimeout = self.timeout
+        if self.progressbar:
+            size = int(sftp.stat(parsed_url["path"]).st_size)
+            with _progress_bar(size) as progress:
+                # Only update the bar every so many bytes, which is much
+                # less often than paramiko delivers reads on large files.
+                threshold = max(2**20, size // 1000)
+                pending = 0
+                with sftp.open(parsed_url["path"], "rb") as remote:
+                    # Queue up read-ahead requests for the whole file so
+                    # the transfer isn't limited to one 32 KiB request per
+                    # round-trip.
+                    remote.prefetch(size)
+                    with open(output_file, "wb") as local:
+                        while True:
+                            data = remote.read(32768)
+                            if not data:
+                                break
+                            local.write(data)
+                            pending += len(data)
+                            if pending >= threshold:
+                                progress.update(pending)
+                                pending = 0
+                if pending:
+                    progress.update(pending)
+        else:
+            with sftp.open(parsed_url["path"], "rb") as remote:
+                # Read ahead instead of waiting a round-trip per request
+                remote.prefetch()
+                with open(output_file, "wb") as local:
+                    shutil.copyfileobj(remote, local, length=2**20)
+
+    def _get_connection(self, host):
+        """
+        Get an authenticated SFTP client for the host, reusing pooled ones.
+
+        Opens a new connection (and stores it in the pool) if there isn't
+        one for this host/port/username yet or if the pooled one has been
+        closed.
+        """
+        key = (host, self.port, self.username)
+        with _SFTP_POOL_LOCK:
+            sftp = _SFTP_POOL.get(key)
+            if sftp is not None:
+                channel = sftp.get_channel()
+                if channel is not None and not channel.closed:
+                    return sftp
+            connection = paramiko.Transport(sock=(host, self.port))
+            # A larger window lets the server keep more data in flight,
+            # which matters on high-latency links.
+            connection.default_window_size = 4 * 2**20
             connection.connect(username=self.username, password=self.password)
             sftp = paramiko.SFTPClient.from_transport(connection)
-            sftp.get_channel().settimeout = self.timeout
-            if self.progressbar:
-                size = int(sftp.stat(parsed_url["path"]).st_size)
-                use_ascii = bool(sys.platform == "win32")
-                progress = tqdm(
-                    total=size,
-                    ncols=79,
-                    ascii=use_ascii,
-                    unit="B",
-                    unit_scale=True,
-                    leave=True,
-                )
-            if self.progressbar:
-                with progress:
+            _SFTP_POOL[key] = sftp
+            return sftp
 
-                    def callback(current, total):
-                        "Update the progress bar and write to output"
-                        progress.total = int(total)
-                        progress.update(int(current - progress.n))
+    @staticmethod
+    def close_all():
+        """
+        Close all pooled SFTP connections.
 
-                    sftp.get(parsed_url["path"], output_file, callback=callback)
-            else:
-                sftp.get(parsed_url["path"], output_file)
-        finally:
-            connection.close()
-            if sftp is not None:
+        Connections are kept open between downloads to avoid repeating the
+        SSH handshake for every file. Call this to release them once you're
+        done downloading.
+        """
+        with _SFTP_POOL_LOCK:
+            for sftp in _SFTP_POOL.values():
+                channel = sftp.get_channel()
+                transport = channel.get_transport() if channel is not None else None
                 sftp.close()
+                if transport is not None:
+                    transport.close()
+            _SFTP_POOL.clear()
 
 
 class DOIDownloader:  # pylint: disable=too-few-public-methods
@@ -585,12 +1353,17 @@ class DOIDownloader:  # pylint: disable=too-few-public-methods
 
     """
 
-    def __init__(self, progressbar=False, chunk_size=1024, **kwargs):
+    # Downloads are delegated to HTTPDownloader, which can write to open file
+    # objects and feed caller-provided hashers (see pooch.core.stream_download)
+    supports_file_objects = True
+    supports_hashers = True
+
+    def __init__(self, progressbar=False, chunk_size=65536, **kwargs):
         self.kwargs = kwargs
         self.progressbar = progressbar
         self.chunk_size = chunk_size
 
-    def __call__(self, url, output_file, pooch):
+    def __call__(self, url, output_file, pooch, hasher=None):
         """
         Download the given DOI URL over HTTP to the given output file.
 
@@ -607,6 +1380,9 @@ class DOIDownloader:  # pylint: disable=too-few-public-methods
             Path (and file name) to which the file will be downloaded.
         pooch : :class:`~pooch.Pooch`
             The instance of :class:`~pooch.Pooch` that is calling this method.
+        hasher : None or hasher object
+            Passed on to the :class:`~pooch.HTTPDownloader` that performs
+            the actual download (see its documentation for the meaning).
 
         """
 
@@ -624,13 +1400,18 @@ class DOIDownloader:  # pylint: disable=too-few-public-methods
         downloader = HTTPDownloader(
             progressbar=self.progressbar, chunk_size=self.chunk_size, **self.kwargs
         )
-        downloader(download_url, output_file, pooch)
+        downloader(download_url, output_file, pooch, hasher=hasher)
 
 
+@functools.lru_cache(maxsize=256)
 def doi_to_url(doi):
     """
     Follow a DOI link to resolve the URL of the archive.
 
+    The resolution is cached per process: DOIs are stable identifiers so
+    repeated lookups (fetching many files from one archive) don't need to
+    hit doi.org again.
+
     Parameters
     ----------
     doi : str
@@ -642,11 +1423,16 @@ def doi_to_url(doi):
         The URL of the archive in the data repository.
 
     """
-    # Lazy import requests to speed up import time
-    import requests  # pylint: disable=C0415
-
-    # Use doi.org to resolve the DOI to the repository website.
-    response = requests.get(f"https://doi.org/{doi}", timeout=DEFAULT_TIMEOUT)
+    # Use doi.org to resolve the DOI to the repository website. A HEAD
+    # request is enough since we only need the redirect target, not the
+    # landing page body.
+    session = _get_session()
+    response = session.head(
+        f"https://doi.org/{doi}", allow_redirects=True, timeout=DEFAULT_TIMEOUT
+    )
+    if response.status_code == 405:
+        # Some servers don't implement HEAD
+        response = session.get(f"https://doi.org/{doi}", timeout=DEFAULT_TIMEOUT)
     url = response.url
     if 400 <= response.status_code < 600:
         raise ValueError(
@@ -655,6 +1441,7 @@ def doi_to_url(doi):
     return url
 
 
+@functools.lru_cache(maxsize=32)
 def doi_to_repository(doi):
     """
     Instantiate a data repository instance from a given DOI.
@@ -662,6 +1449,11 @@ def doi_to_repository(doi):
     This function implements the chain of responsibility dispatch
     to the correct data repository class.
 
+    Repositories are cached per process so that fetching many files from the
+    same archive reuses a single instance (and with it the instance's cached
+    API responses) instead of resolving the DOI and fetching the file listing
+    once per file.
+
     Parameters
     ----------
     doi : str
@@ -679,18 +1471,12 @@ def doi_to_repository(doi):
     if doi[-1] == "/":
         doi = doi[:-1]
 
-    repositories = [
-        FigshareRepository,
-        ZenodoRepository,
-        DataverseRepository,
-    ]
-
     # Extract the DOI and the repository information
     archive_url = doi_to_url(doi)
 
     # Try the converters one by one until one of them returned a URL
     data_repository = None
-    for repo in repositories:
+    for repo in _DATA_REPOSITORIES:
         if data_repository is None:
             data_repository = repo.initialize(
                 archive_url=archive_url,
@@ -769,6 +1555,7 @@ class ZenodoRepository(DataRepository):  # pylint: disable=missing-class-docstri
         self.doi = doi
         self._api_response = None
         self._api_version = None
+        self._files = None
 
     @classmethod
     def initialize(cls, doi, archive_url):
@@ -790,8 +1577,7 @@ class ZenodoRepository(DataRepository):  # pylint: disable=missing-class-docstri
         """
 
         # Check whether this is a Zenodo URL
-        parsed_archive_url = parse_url(archive_url)
-        if parsed_archive_url["netloc"] != "zenodo.org":
+        if urlsplit(archive_url).netloc != "zenodo.org":
             return None
 
         return cls(doi, archive_url)
@@ -800,14 +1586,16 @@ class ZenodoRepository(DataRepository):  # pylint: disable=missing-class-docstri
     def api_response(self):
         """Cached API response from Zenodo"""
         if self._api_response is None:
-            # Lazy import requests to speed up import time
-            import requests  # pylint: disable=C0415
-
             article_id = self.archive_url.split("/")[-1]
-            self._api_response = requests.get(
-                f"{self.base_api_url}/{article_id}",
-                timeout=DEFAULT_TIMEOUT,
-            ).json()
+            self._api_response = _loads(
+                _get_session()
+                .get(
+                    f"{self.base_api_url}/{article_id}",
+                    headers=_JSON_HEADERS,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                .content
+            )
 
         return self._api_response
 
@@ -867,11 +1655,18 @@ class ZenodoRepository(DataRepository):  # pylint: disable=missing-class-docstri
 
         This method supports both the legacy and the new API.
         """
-        # Create list of files in the repository
-        if self.api_version == "legacy":
-            files = {item["key"]: item for item in self.api_response["files"]}
-        else:
-            files = [item["filename"] for item in self.api_response["files"]]
+        # Map file names to their API entries, cached between calls so that
+        # fetching many files from the archive only builds it once
+        if self._files is None:
+            if self.api_version == "legacy":
+                self._files = {
+                    item["key"]: item for item in self.api_response["files"]
+                }
+            else:
+                self._files = {
+                    item["filename"]: item for item in self.api_response["files"]
+                }
+        files = self._files
         # Check if file exists in the repository
         if file_name not in files:
             raise ValueError(
@@ -919,6 +1714,7 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
         self.archive_url = archive_url
         self.doi = doi
         self._api_response = None
+        self._files = None
 
     @classmethod
     def initialize(cls, doi, archive_url):
@@ -940,8 +1736,7 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
         """
 
         # Check whether this is a Figshare URL
-        parsed_archive_url = parse_url(archive_url)
-        if parsed_archive_url["netloc"] != "figshare.com":
+        if urlsplit(archive_url).netloc != "figshare.com":
             return None
 
         return cls(doi, archive_url)
@@ -966,14 +1761,16 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
     def api_response(self):
         """Cached API response from Figshare"""
         if self._api_response is None:
-            # Lazy import requests to speed up import time
-            import requests  # pylint: disable=C0415
-
             # Use the figshare API to find the article ID from the DOI
-            article = requests.get(
-                f"https://api.figshare.com/v2/articles?doi={self.doi}",
-                timeout=DEFAULT_TIMEOUT,
-            ).json()[0]
+            article = _loads(
+                _get_session()
+                .get(
+                    f"https://api.figshare.com/v2/articles?doi={self.doi}",
+                    headers=_JSON_HEADERS,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                .content
+            )[0]
             article_id = article["id"]
             # Parse desired version from the doi
             version = self._parse_version_from_doi()
@@ -988,6 +1785,12 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
                     "Figshare will point to the latest version available.",
                     UserWarning,
                 )
+                # The article search response usually already includes the
+                # file listing of the latest version, in which case a second
+                # API call would only fetch the same data again.
+                if article.get("files"):
+                    self._api_response = article["files"]
+                    return self._api_response
                 # Define API url using only the article id
                 # (figshare will resolve the latest version)
                 api_url = f"https://api.figshare.com/v2/articles/{article_id}"
@@ -999,9 +1802,11 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
                     f"{article_id}/versions/{version}"
                 )
             # Make the request and return the files in the figshare repository
-            response = requests.get(api_url, timeout=DEFAULT_TIMEOUT)
+            response = _get_session().get(
+                api_url, headers=_JSON_HEADERS, timeout=DEFAULT_TIMEOUT
+            )
             response.raise_for_status()
-            self._api_response = response.json()["files"]
+            self._api_response = _loads(response.content)["files"]
 
         return self._api_response
 
@@ -1020,7 +1825,11 @@ class FigshareRepository(DataRepository):  # pylint: disable=missing-class-docst
         download_url : str
             The HTTP URL that can be used to download the file.
         """
-        files = {item["name"]: item for item in self.api_response}
+        # Map file names to their API entries, cached between calls so that
+        # fetching many files from the archive only builds it once
+        if self._files is None:
+            self._files = {item["name"]: item for item in self.api_response}
+        files = self._files
         if file_name not in files:
             raise ValueError(
                 f"File '{file_name}' not found in data archive {self.archive_url} (doi:{self.doi})."
@@ -1047,6 +1856,9 @@ class DataverseRepository(DataRepository):  # pylint: disable=missing-class-docs
         self.archive_url = archive_url
         self.doi = doi
         self._api_response = None
+        self._files = None
+        # Parse the URL once instead of on every download_url call
+        self._parsed_archive_url = urlsplit(archive_url)
 
     @classmethod
     def initialize(cls, doi, archive_url):
@@ -1086,13 +1898,11 @@ class DataverseRepository(DataRepository):  # pylint: disable=missing-class-docs
         This has been separated into a separate ``classmethod``, as it can be
         used prior and after the initialization.
         """
-        # Lazy import requests to speed up import time
-        import requests  # pylint: disable=C0415
-
-        parsed = parse_url(archive_url)
-        response = requests.get(
-            f"{parsed['protocol']}://{parsed['netloc']}/api/datasets/"
+        parsed = urlsplit(archive_url)
+        response = _get_session().get(
+            f"{parsed.scheme}://{parsed.netloc}/api/datasets/"
             f":persistentId?persistentId=doi:{doi}",
+            headers=_JSON_HEADERS,
             timeout=DEFAULT_TIMEOUT,
         )
         return response
@@ -1129,12 +1939,16 @@ class DataverseRepository(DataRepository):  # pylint: disable=missing-class-docs
         download_url : str
             The HTTP URL that can be used to download the file.
         """
-        parsed = parse_url(self.archive_url)
-        response = self.api_response.json()
-        files = {
-            file["dataFile"]["filename"]: file["dataFile"]
-            for file in response["data"]["latestVersion"]["files"]
-        }
+        parsed = self._parsed_archive_url
+        if self._files is None:
+            # Build the name -> file mapping once so that looking up M files
+            # in an N-file dataset is O(M) instead of O(M*N)
+            response = _loads(self.api_response.content)
+            self._files = {
+                file["dataFile"]["filename"]: file["dataFile"]
+                for file in response["data"]["latestVersion"]["files"]
+            }
+        files = self._files
         if file_name not in files:
             raise ValueError(
                 f"File '{file_name}' not found in data archive "
@@ -1142,7 +1956,7 @@ class DataverseRepository(DataRepository):  # pylint: disable=missing-class-docs
             )
         # Generate download_url using the file id
         download_url = (
-            f"{parsed['protocol']}://{parsed['netloc']}/api/access/datafile/"
+            f"{parsed.scheme}://{parsed.netloc}/api/access/datafile/"
             f"{files[file_name]['id']}"
         )
         return download_url
@@ -1157,7 +1971,30 @@ class DataverseRepository(DataRepository):  # pylint: disable=missing-class-docs
             The pooch instance that the registry will be added to.
         """
 
-        for filedata in self.api_response.json()["data"]["latestVersion"]["files"]:
+        data = _loads(self.api_response.content)
+        for filedata in data["data"]["latestVersion"]["files"]:
             pooch.registry[filedata["dataFile"]["filename"]] = (
                 f"md5:{filedata['dataFile']['md5']}"
             )
+
+
+# Map from URL protocol to the downloader class that handles it (used by
+# choose_downloader). Defined down here so the classes exist. The second dict
+# holds lazily created default (no progress bar, no custom arguments)
+# instances that are shared between choose_downloader calls.
+# Data repository classes tried in order by doi_to_repository. Defined down
+# here so the classes exist.
+_DATA_REPOSITORIES = [
+    FigshareRepository,
+    ZenodoRepository,
+    DataverseRepository,
+]
+
+_KNOWN_DOWNLOADERS = {
+    "ftp": FTPDownloader,
+    "https": HTTPDownloader,
+    "http": HTTPDownloader,
+    "sftp": SFTPDownloader,
+    "doi": DOIDownloader,
+}
+_DEFAULT_DOWNLOADERS = {}
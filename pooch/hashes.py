@@ -7,6 +7,8 @@
 """
 Calculating and checking file hashes.
 """
+import os
+import mmap
 import hashlib
 import functools
 from pathlib import Path
@@ -39,6 +41,55 @@ try:
 except ImportError:
     pass
 
+try:
+    import blake3
+
+    ALGORITHMS_AVAILABLE["blake3"] = blake3.blake3
+except ImportError:
+    blake3 = None
+
+# Hash files larger than this (in bytes) through a memory map instead of
+# chunked reads to avoid the copy into userspace buffers.
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+class HashMismatchError(ValueError):
+    """
+    The hash of a downloaded file does not match the expected known hash.
+
+    Raised by :func:`~pooch.hashes.hash_matches` and
+    :func:`~pooch.hashes.digest_matches` in strict mode. Subclasses
+    :class:`ValueError` so existing code catching that still works, while
+    letting download retry logic tell a corrupted transfer (worth retrying)
+    apart from other errors raised with :class:`ValueError`.
+    """
+
+
+def _file_hash_mmap(fname, alg, size):
+    """
+    Hash a file through a memory map, letting the kernel feed pages directly.
+
+    Advises the kernel that access is sequential (where supported) and feeds
+    the hash 16 MiB windows of the mapping so no userspace read buffer is
+    needed. Returns the hex digest or None if the file can't be memory-mapped
+    (the caller should fall back to chunked reads).
+    """
+    window = 16 * 1024 * 1024
+    try:
+        with open(fname, "rb") as fin:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                if hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapping.madvise(mmap.MADV_SEQUENTIAL)
+                hasher = ALGORITHMS_AVAILABLE[alg]()
+                with memoryview(mapping) as view:
+                    for start in range(0, size, window):
+                        hasher.update(view[start : start + window])
+                return hasher.hexdigest()
+    except (OSError, ValueError, OverflowError):
+        # Some filesystems and platforms can't mmap the file. Fall back to
+        # reading it in chunks.
+        return None
+
 
 def file_hash(fname, alg="sha256"):
     """
@@ -51,7 +102,9 @@ def file_hash(fname, alg="sha256"):
     fname : str
         The name of the file.
     alg : str
-        The type of the hashing algorithm
+        The type of the hashing algorithm. Can be any algorithm from
+        :mod:`hashlib`, as well as ``xxhash`` and ``blake3`` variants if the
+        respective packages are installed.
 
     Returns
     -------
@@ -76,8 +129,27 @@ def file_hash(fname, alg="sha256"):
             "Only the following algorithms are available "
             f"{list(ALGORITHMS_AVAILABLE.keys())}."
         )
+    # Use a large read buffer (1 MiB) to cut down the number of syscalls when
+    # hashing large files.
+    chunksize = 1 << 20
+    if blake3 is not None and alg == "blake3":
+        # blake3 can hash with multiple threads and memory-map the file
+        # internally, which is much faster than reading it in chunks.
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(fname)
+        return hasher.hexdigest()
+    size = os.path.getsize(fname)
+    if size > _MMAP_THRESHOLD:
+        digest = _file_hash_mmap(fname, alg, size)
+        if digest is not None:
+            return digest
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: optimized C read loop that releases the GIL
+        with open(fname, "rb") as fin:
+            return hashlib.file_digest(
+                fin, ALGORITHMS_AVAILABLE[alg], _bufsize=chunksize
+            ).hexdigest()
     # Calculate the hash in chunks to avoid overloading the memory
-    chunksize = 65536
     hasher = ALGORITHMS_AVAILABLE[alg]()
     with open(fname, "rb") as fin:
         buff = fin.read(chunksize)
@@ -134,6 +206,32 @@ def hash_algorithm(hash_string):
     return algorithm.lower()
 
 
+def new_hasher(algorithm="sha256"):
+    """
+    Create a new hasher object for the given algorithm name.
+
+    Parameters
+    ----------
+    algorithm : str
+        Name of the hashing algorithm (must be one of the keys of
+        ``ALGORITHMS_AVAILABLE``).
+
+    Returns
+    -------
+    hasher
+        A new instance of the hasher (with an ``update`` method and a
+        ``hexdigest`` method, like the :mod:`hashlib` ones).
+
+    """
+    if algorithm not in ALGORITHMS_AVAILABLE:
+        raise ValueError(
+            f"Algorithm '{algorithm}' not available to the pooch library. "
+            "Only the following algorithms are available "
+            f"{list(ALGORITHMS_AVAILABLE.keys())}."
+        )
+    return ALGORITHMS_AVAILABLE[algorithm]()
+
+
 def hash_matches(fname, known_hash, strict=False, source=None):
     """
     Check if the hash of a file matches a known hash.
@@ -151,8 +249,8 @@ def hash_matches(fname, known_hash, strict=False, source=None):
         The known hash. Optionally, prepend ``alg:`` to the hash to specify the
         hashing algorithm. Default is SHA256.
     strict : bool
-        If True, will raise a :class:`ValueError` if the hash does not match
-        informing the user that the file may be corrupted.
+        If True, will raise a :class:`~pooch.hashes.HashMismatchError` if the
+        hash does not match informing the user that the file may be corrupted.
     source : str
         The source of the downloaded file (name or URL, for example). Will be
         used in the error message if *strict* is True. Has no other use other
@@ -169,19 +267,112 @@ def hash_matches(fname, known_hash, strict=False, source=None):
         return True
     algorithm = hash_algorithm(known_hash)
     new_hash = file_hash(fname, alg=algorithm)
-    matches = new_hash.lower() == known_hash.split(":")[-1].lower()
+    if source is None:
+        source = str(fname)
+    return digest_matches(new_hash, known_hash, strict=strict, source=source)
+
+
+def digest_matches(digest, known_hash, strict=False, source=None):
+    """
+    Check if a pre-computed hex digest matches a known hash.
+
+    Use this when the digest was calculated while the file was being
+    downloaded (see :class:`~pooch.hashes.HashingFile`) to avoid re-reading
+    the file from disk.
+
+    Parameters
+    ----------
+    digest : str
+        The hex digest that was computed for the file.
+    known_hash : str
+        The known hash. Optionally, prepend ``alg:`` to the hash to specify the
+        hashing algorithm. Default is SHA256.
+    strict : bool
+        If True, will raise a :class:`~pooch.hashes.HashMismatchError` if the
+        hash does not match informing the user that the file may be corrupted.
+    source : str
+        The source of the downloaded file (name or URL, for example). Will be
+        used in the error message if *strict* is True.
+
+    Returns
+    -------
+    is_same : bool
+        True if the hash matches, False otherwise.
+
+    """
+    if known_hash is None:
+        return True
+    # Split the known hash only once to get both the algorithm and the
+    # expected digest (instead of a separate hash_algorithm call).
+    if ":" in known_hash:
+        algorithm, expected = known_hash.rsplit(":", 1)
+        algorithm = algorithm.lower()
+    else:
+        algorithm = "sha256"
+        expected = known_hash
+    matches = digest.lower() == expected.lower()
     if strict and not matches:
-        if source is None:
-            source = str(fname)
-        raise ValueError(
+        raise HashMismatchError(
             f"{algorithm.upper()} hash of downloaded file ({source}) does not match"
-            f" the known hash: expected {known_hash} but got {new_hash}. Deleted"
+            f" the known hash: expected {known_hash} but got {digest}. Deleted"
             " download for safety. The downloaded file may have been corrupted or"
             " the known hash may be outdated."
         )
     return matches
 
 
+class HashingFile:  # pylint: disable=too-few-public-methods
+    """
+    Wrap an open binary file and hash the data as it's being written.
+
+    Lets downloads compute the hash of the file while it's streamed to disk,
+    avoiding a full re-read of the file for verification afterwards.
+
+    Parameters
+    ----------
+    fileobj : file-like object
+        An open file-like object (binary mode) that the data will be written
+        to.
+    algorithm : str or hasher object
+        Name of the hashing algorithm (must be one of the keys of
+        ``ALGORITHMS_AVAILABLE``) or an already created hasher object (with
+        ``update`` and ``hexdigest`` methods). Pass a hasher to continue
+        hashing data that was already fed through it, for example when
+        resuming an interrupted download.
+
+    """
+
+    def __init__(self, fileobj, algorithm="sha256"):
+        if hasattr(algorithm, "update"):
+            self.hasher = algorithm
+        else:
+            self.hasher = new_hasher(algorithm)
+        self.fileobj = fileobj
+
+    def write(self, data):
+        "Update the hash with the given data and write it to the file."
+        self.hasher.update(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        "Flush the underlying file object."
+        return self.fileobj.flush()
+
+    def fileno(self):
+        "The file descriptor of the underlying file object."
+        # Needed so downloaders can preallocate the disk space for the
+        # download (posix_fallocate) even when writing through the wrapper.
+        return self.fileobj.fileno()
+
+    def close(self):
+        "Close the underlying file object."
+        return self.fileobj.close()
+
+    def hexdigest(self):
+        "The hex digest of all the data written so far."
+        return self.hasher.hexdigest()
+
+
 def make_registry(directory, output, recursive=True):
     """
     Make a registry of files and hashes for the given directory.
@@ -17,7 +17,7 @@ import pytest
 
 from ..core import create, Pooch, retrieve, download_action, stream_download
 from ..utils import get_logger, temporary_file, os_cache
-from ..hashes import file_hash, hash_matches
+from ..hashes import file_hash, digest_matches
 
 # Import the core module so that we can monkeypatch some functions
 from .. import core
@@ -192,27 +192,92 @@ def test_pooch_download(url):
             assert log_file.getvalue() == ""
 
 
-class FakeHashMatches:  # pylint: disable=too-few-public-methods
-    "Create a fake version of hash_matches that fails n times"
+@pytest.mark.network
+def test_pooch_fetch_many():
+    "Fetch multiple files concurrently with a single call"
+    with TemporaryDirectory() as local_store:
+        path = Path(local_store)
+        pup = Pooch(path=path, base_url=BASEURL, registry=REGISTRY)
+        fnames = ["tiny-data.txt", "large-data.txt"]
+        paths = pup.fetch_many(fnames)
+        assert list(paths.keys()) == fnames
+        assert paths["tiny-data.txt"] == str(path / "tiny-data.txt")
+        check_tiny_data(paths["tiny-data.txt"])
+        check_large_data(paths["large-data.txt"])
+
+
+def test_pooch_fetch_many_local(data_dir_mirror):
+    "fetch_many should work without downloading if the files exist locally"
+    pup = Pooch(path=data_dir_mirror, base_url="some bogus URL", registry=REGISTRY)
+    fnames = ["tiny-data.txt", "large-data.txt"]
+    paths = pup.fetch_many(fnames)
+    assert list(paths.keys()) == fnames
+    check_tiny_data(paths["tiny-data.txt"])
+    check_large_data(paths["large-data.txt"])
+    assert pup.fetch_many([]) == {}
+    with pytest.raises(ValueError):
+        pup.fetch_many(["tiny-data.txt", "not-a-real-file.txt"])
+
+
+def test_pooch_verify_all(data_dir_mirror):
+    "verify_all should check local files against the registry in parallel"
+    registry = {"not-on-disk.txt": "notarealhash"}
+    registry.update(REGISTRY)
+    pup = Pooch(path=data_dir_mirror, base_url="some bogus URL", registry=registry)
+    status = pup.verify_all(["tiny-data.txt", "not-on-disk.txt"])
+    assert status == {"tiny-data.txt": True, "not-on-disk.txt": False}
+    # Corrupt a file and check that it's caught
+    with open(data_dir_mirror / "tiny-data.txt", "a", encoding="utf-8") as fout:
+        fout.write("corruption")
+    status = pup.verify_all()
+    assert not status["tiny-data.txt"]
+    assert list(status.keys()) == list(registry.keys())
+    # Unknown files should raise an error
+    with pytest.raises(ValueError):
+        pup.verify_all(["not-in-the-registry.txt"])
+
+
+class FakeDigestMatches:  # pylint: disable=too-few-public-methods
+    "Create a fake version of digest_matches that fails n times"
 
     def __init__(self, nfailures):
         self.nfailures = nfailures
         self.failed = 0
 
-    def hash_matches(self, *args, **kwargs):
+    def digest_matches(self, *args, **kwargs):
         "Fail n times before finally passing"
         if self.failed < self.nfailures:
             self.failed += 1
             # Give it an invalid hash to force a failure
-            return hash_matches(args[0], "bla", **kwargs)
-        return hash_matches(*args, **kwargs)
+            return digest_matches(args[0], "bla", **kwargs)
+        return digest_matches(*args, **kwargs)
+
+
+class FakeFlakyDownloader:  # pylint: disable=too-few-public-methods
+    "Downloader that fails with a connection error n times before passing"
+
+    def __init__(self, nfailures):
+        self.nfailures = nfailures
+        self.failed = 0
+        self.downloader = HTTPDownloader()
+
+    def __call__(self, *args, **kwargs):
+        "Raise a connection error n times before downloading for real"
+        import requests  # pylint: disable=import-outside-toplevel
+
+        if self.failed < self.nfailures:
+            self.failed += 1
+            raise requests.exceptions.ConnectionError("simulated network error")
+        return self.downloader(*args, **kwargs)
 
 
 @pytest.mark.network
 def test_pooch_download_retry_off_by_default(monkeypatch):
     "Check that retrying the download is off by default"
     with TemporaryDirectory() as local_store:
-        monkeypatch.setattr(core, "hash_matches", FakeHashMatches(3).hash_matches)
+        monkeypatch.setattr(
+            core, "digest_matches", FakeDigestMatches(3).digest_matches
+        )
         # Setup a pooch without download retrying
         path = Path(local_store)
         pup = Pooch(path=path, base_url=BASEURL, registry=REGISTRY)
@@ -241,21 +306,21 @@ class FakeSleep:  # pylint: disable=too-few-public-methods
 
 @pytest.mark.network
 def test_pooch_download_retry(monkeypatch):
-    "Check that retrying the download works if the hash is different"
+    "Check that retrying the download works for network errors"
     with TemporaryDirectory() as local_store:
-        monkeypatch.setattr(core, "hash_matches", FakeHashMatches(11).hash_matches)
         fakesleep = FakeSleep()
         monkeypatch.setattr(core.time, "sleep", fakesleep.sleep)
         # Setup a pooch with download retrying
         path = Path(local_store)
         true_path = str(path / "tiny-data.txt")
         retries = 11
+        downloader = FakeFlakyDownloader(retries)
         pup = Pooch(
             path=path, base_url=BASEURL, registry=REGISTRY, retry_if_failed=retries
         )
         # Check that the logs say that the download failed n times
         with capture_log() as log_file:
-            fname = pup.fetch("tiny-data.txt")
+            fname = pup.fetch("tiny-data.txt", downloader=downloader)
             logs = log_file.getvalue().strip().split("\n")
             assert len(logs) == 1 + retries
             assert logs[0].startswith("Downloading")
@@ -264,33 +329,57 @@ def test_pooch_download_retry(monkeypatch):
                 assert "Failed to download" in line
                 plural = "s" if i > 1 else ""
                 assert f"download again {i} more time{plural}." in line
-            # Check that the sleep time increases but stops at 10s
-            assert fakesleep.times == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10]
+            # Check that the backoff grows exponentially (with up to 1s of
+            # jitter) and is capped at 10s
+            assert len(fakesleep.times) == retries
+            for i, secs in enumerate(fakesleep.times):
+                assert min(2**i, 10) <= secs <= min(2**i + 1, 10)
         # Check that the downloaded file has the right content
         assert true_path == fname
         check_tiny_data(fname)
         assert file_hash(fname) == REGISTRY["tiny-data.txt"]
 
 
+@pytest.mark.network
+def test_pooch_download_retry_hash_mismatch_once(monkeypatch):
+    "A hash mismatch should only be retried a single time"
+    with TemporaryDirectory() as local_store:
+        monkeypatch.setattr(
+            core, "digest_matches", FakeDigestMatches(1).digest_matches
+        )
+        # Plenty of retries available but only one should be used
+        path = Path(local_store)
+        pup = Pooch(path=path, base_url=BASEURL, registry=REGISTRY, retry_if_failed=5)
+        with capture_log() as log_file:
+            fname = pup.fetch("tiny-data.txt")
+            logs = log_file.getvalue().strip().split("\n")
+            assert len(logs) == 2
+            assert logs[0].startswith("Downloading")
+            assert "doesn't match the known hash" in logs[1]
+        check_tiny_data(fname)
+
+
 @pytest.mark.network
 def test_pooch_download_retry_fails_eventually(monkeypatch):
     "Check that retrying the download fails after the set amount of retries"
     with TemporaryDirectory() as local_store:
-        monkeypatch.setattr(core, "hash_matches", FakeHashMatches(3).hash_matches)
+        monkeypatch.setattr(
+            core, "digest_matches", FakeDigestMatches(3).digest_matches
+        )
         # Setup a pooch with insufficient retry attempts
         path = Path(local_store)
         pup = Pooch(path=path, base_url=BASEURL, registry=REGISTRY, retry_if_failed=1)
-        # Make sure it fails with no retries
+        # Make sure it fails after the single hash-mismatch retry
         with pytest.raises(ValueError) as error:
-            # Check that the logs say that the download failed n times
+            # Check that the logs say that the download failed
             with capture_log() as log_file:
                 pup.fetch("tiny-data.txt")
+        assert "does not match the known hash" in str(error)
         logs = log_file.getvalue().strip().split("\n")
         assert len(logs) == 2
         assert logs[0].startswith("Downloading")
         assert logs[0].endswith(f"'{path}'.")
-        assert "Failed to download" in logs[1]
-        assert "download again 1 more time." in logs[1]
+        assert "doesn't match the known hash" in logs[1]
         assert "does not match the known hash" in str(error)
 
 
@@ -499,6 +588,24 @@ def test_check_availability():
     assert not pup.is_available("not-a-real-data-file.txt")
 
 
+@pytest.mark.network
+def test_check_availability_many():
+    "Batched availability check should match the per-file results"
+    registry = {"not-a-real-data-file.txt": "notarealhash"}
+    registry.update(REGISTRY)
+    pup = Pooch(path=DATA_DIR, base_url=BASEURL, registry=registry)
+    availability = pup.is_available_many(
+        ["tiny-data.txt", "not-a-real-data-file.txt"]
+    )
+    assert availability == {
+        "tiny-data.txt": True,
+        "not-a-real-data-file.txt": False,
+    }
+    # Wrong file name should raise an error like is_available
+    with pytest.raises(ValueError):
+        pup.is_available_many(["tiny-data.txt", "not-in-the-registry.txt"])
+
+
 def test_check_availability_on_ftp(ftpserver):
     "Should correctly check availability of existing and non existing files"
     with data_over_ftp(ftpserver, "tiny-data.txt") as url:
@@ -608,6 +715,85 @@ def test_download_action():
     assert verb == "Fetching"
 
 
+def test_download_action_trust_mtime(monkeypatch):
+    "The sidecar fast path should skip hashing when POOCH_TRUST_MTIME is set"
+    # pylint: disable=protected-access
+    monkeypatch.setenv("POOCH_TRUST_MTIME", "1")
+    with temporary_file() as tmp:
+        with open(tmp, "w", encoding="utf-8") as output:
+            output.write("some data")
+        known_hash = file_hash(tmp)
+        core._write_verified_sidecar(tmp, known_hash)
+        sidecar = core._sidecar_path(tmp)
+        assert os.path.exists(sidecar)
+        try:
+            # Make sure the file is never actually hashed
+            def no_hashing(*args, **kwargs):
+                raise AssertionError("should not hash the file")
+
+            monkeypatch.setattr(core, "hash_matches", no_hashing)
+            action, verb = download_action(Path(tmp), known_hash=known_hash)
+            assert action == "fetch"
+            assert verb == "Fetching"
+            # Modifying the file invalidates the sidecar record
+            monkeypatch.undo()
+            monkeypatch.setenv("POOCH_TRUST_MTIME", "1")
+            with open(tmp, "w", encoding="utf-8") as output:
+                output.write("more data than before")
+            action, verb = download_action(Path(tmp), known_hash=known_hash)
+            assert action == "update"
+            assert verb == "Updating"
+        finally:
+            os.remove(sidecar)
+
+
+def test_download_action_size_mismatch(monkeypatch):
+    "A size change since the last verified download should skip the hashing"
+    # pylint: disable=protected-access
+    with temporary_file() as tmp:
+        with open(tmp, "w", encoding="utf-8") as output:
+            output.write("some data")
+        known_hash = file_hash(tmp)
+        core._write_verified_sidecar(tmp, known_hash)
+        sidecar = core._sidecar_path(tmp)
+        try:
+            # Change the file contents to a different size
+            with open(tmp, "w", encoding="utf-8") as output:
+                output.write("more data than before")
+
+            # Make sure the file is never actually hashed
+            def no_hashing(*args, **kwargs):
+                raise AssertionError("should not hash the file")
+
+            monkeypatch.setattr(core, "hash_matches", no_hashing)
+            action, verb = download_action(Path(tmp), known_hash=known_hash)
+            assert action == "update"
+            assert verb == "Updating"
+        finally:
+            os.remove(sidecar)
+
+
+def test_download_action_skip_hash(monkeypatch):
+    "POOCH_SKIP_HASH should take any existing file without hashing it"
+    monkeypatch.setenv("POOCH_SKIP_HASH", "1")
+    with temporary_file() as tmp:
+        with open(tmp, "w", encoding="utf-8") as output:
+            output.write("some data")
+
+        # Make sure the file is never actually hashed
+        def no_hashing(*args, **kwargs):
+            raise AssertionError("should not hash the file")
+
+        monkeypatch.setattr(core, "hash_matches", no_hashing)
+        action, verb = download_action(Path(tmp), known_hash="blablabla")
+        assert action == "fetch"
+        assert verb == "Fetching"
+        # Missing files still need to be downloaded
+        action, verb = download_action(Path(tmp + ".missing"), known_hash="blablabla")
+        assert action == "download"
+        assert verb == "Downloading"
+
+
 @pytest.mark.network
 @pytest.mark.parametrize("fname", ["tiny-data.txt", "subdir/tiny-data.txt"])
 def test_stream_download(fname):
@@ -624,6 +810,96 @@ def test_stream_download(fname):
         check_tiny_data(str(destination))
 
 
+def test_stream_download_etag_sidecar():
+    "The ETag sidecar should be keyed to the final file name, not the temp"
+
+    def downloader(url, output_file, pup):  # pylint: disable=unused-argument
+        "Fake downloader that saves an ETag sidecar like HTTPDownloader"
+        with open(output_file, "w", encoding="utf-8") as fout:
+            fout.write("some data")
+        with open(str(output_file) + ".etag", "w", encoding="utf-8") as fout:
+            fout.write('"abc123"')
+
+    downloader.supports_file_objects = False
+    with TemporaryDirectory() as local_store:
+        destination = os.path.join(local_store, "data.txt")
+        stream_download(
+            "https://fake.url/data.txt", destination, None, downloader, pooch=None
+        )
+        # The sidecar must follow the file. No stray temporary files allowed.
+        assert sorted(os.listdir(local_store)) == ["data.txt", "data.txt.etag"]
+
+
+def test_stream_download_resumable():
+    "Resumable downloaders leave a '.part' that is verified then moved"
+    data = b"some data"
+    known_hash = f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    def downloader(url, output_file, pup, hasher):  # pylint: disable=unused-argument
+        "Fake downloader that follows the supports_hashers contract"
+        with open(str(output_file) + ".part", "wb") as fout:
+            fout.write(data)
+        hasher.update(data)
+
+    downloader.supports_hashers = True
+    with TemporaryDirectory() as local_store:
+        destination = os.path.join(local_store, "data.txt")
+        stream_download(
+            "https://fake.url/data.txt", destination, known_hash, downloader, pooch=None
+        )
+        assert sorted(os.listdir(local_store)) == [
+            "data.txt",
+            "data.txt.pooch-verified",
+        ]
+        with open(destination, "rb") as fin:
+            assert fin.read() == data
+
+
+def test_stream_download_resumable_mismatch():
+    "A hash mismatch should remove the '.part' and not touch the destination"
+
+    def downloader(url, output_file, pup, hasher):  # pylint: disable=unused-argument
+        "Fake downloader that produces data that won't match the known hash"
+        data = b"not the right data"
+        with open(str(output_file) + ".part", "wb") as fout:
+            fout.write(data)
+        hasher.update(data)
+
+    downloader.supports_hashers = True
+    with TemporaryDirectory() as local_store:
+        destination = os.path.join(local_store, "data.txt")
+        with pytest.raises(ValueError):
+            stream_download(
+                "https://fake.url/data.txt",
+                destination,
+                f"sha256:{hashlib.sha256(b'some data').hexdigest()}",
+                downloader,
+                pooch=None,
+            )
+        # The corrupted partial can't be resumed, so it must not be left
+        # behind to poison the next attempt
+        assert os.listdir(local_store) == []
+
+
+def test_stream_download_failure_removes_partial():
+    "A failed download should not leave a '.part' partial file behind"
+
+    def downloader(url, output_file, pup):  # pylint: disable=unused-argument
+        "Fake downloader that fails mid-download, leaving a partial file"
+        with open(str(output_file) + ".part", "w", encoding="utf-8") as fout:
+            fout.write("half of the data")
+        raise ValueError("download failed")
+
+    downloader.supports_file_objects = False
+    with TemporaryDirectory() as local_store:
+        destination = os.path.join(local_store, "data.txt")
+        with pytest.raises(ValueError):
+            stream_download(
+                "https://fake.url/data.txt", destination, None, downloader, pooch=None
+            )
+        assert os.listdir(local_store) == []
+
+
 @pytest.mark.network
 @pytest.mark.parametrize(
     "url",
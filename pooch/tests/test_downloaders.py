@@ -23,9 +23,15 @@ try:
 except ImportError:
     paramiko = None
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 from .. import Pooch
 from ..downloaders import (
     HTTPDownloader,
+    AsyncHTTPDownloader,
     FTPDownloader,
     SFTPDownloader,
     DOIDownloader,
@@ -34,6 +40,10 @@ from ..downloaders import (
     ZenodoRepository,
     DataverseRepository,
     doi_to_url,
+    _cached_nlst,
+    _NLST_CACHE,
+    _read_etag,
+    _write_etag,
 )
 from ..processors import Unzip
 from .utils import (
@@ -209,6 +219,20 @@ def test_figshare_data_repository_versions(version, missing, present):
     assert missing not in filenames
 
 
+@pytest.mark.network
+def test_http_download_many():
+    "Test downloading several files over HTTP concurrently"
+    with TemporaryDirectory() as local_store:
+        downloader = HTTPDownloader()
+        jobs = [
+            (BASEURL + name, os.path.join(local_store, name))
+            for name in ["tiny-data.txt", "large-data.txt"]
+        ]
+        downloader.download_many(jobs)
+        check_tiny_data(jobs[0][1])
+        check_large_data(jobs[1][1])
+
+
 @pytest.mark.network
 def test_ftp_downloader(ftpserver):
     "Test ftp downloader"
@@ -220,6 +244,47 @@ def test_ftp_downloader(ftpserver):
             check_tiny_data(outfile)
 
 
+def test_cached_nlst():
+    "Repeated listings of the same directory should hit the cache"
+
+    class FakeFTP:  # pylint: disable=too-few-public-methods
+        "Counts how many times the directory is actually listed"
+
+        def __init__(self):
+            self.calls = 0
+
+        def nlst(self, directory):  # pylint: disable=unused-argument
+            "Fake listing of a remote directory"
+            self.calls += 1
+            return ["tiny-data.txt", "subdir"]
+
+    ftp = FakeFTP()
+    try:
+        listing = _cached_nlst(ftp, "fake.server", 21, "/data")
+        assert "tiny-data.txt" in listing
+        assert _cached_nlst(ftp, "fake.server", 21, "/data") == listing
+        assert ftp.calls == 1
+        # A different directory is a cache miss
+        _cached_nlst(ftp, "fake.server", 21, "/other")
+        assert ftp.calls == 2
+    finally:
+        _NLST_CACHE.clear()
+
+
+def test_etag_sidecar():
+    "ETags should round-trip through the sidecar file"
+    with TemporaryDirectory() as local_store:
+        fname = os.path.join(local_store, "tiny-data.txt")
+        # No sidecar yet
+        assert _read_etag(fname) is None
+        _write_etag(fname, '"abc123"')
+        assert _read_etag(fname) == '"abc123"'
+        # An empty ETag shouldn't create a sidecar
+        other = os.path.join(local_store, "other.txt")
+        _write_etag(other, None)
+        assert _read_etag(other) is None
+
+
 @pytest.mark.network
 @pytest.mark.skipif(paramiko is None, reason="requires paramiko to run SFTP")
 def test_sftp_downloader():
@@ -245,6 +310,29 @@ def test_sftp_downloader_fail_if_file_object():
                 downloader(url, outfile_obj, None)
 
 
+@pytest.mark.network
+@pytest.mark.skipif(aiohttp is None, reason="requires aiohttp")
+def test_async_http_download_many():
+    "Test downloading several files concurrently through asyncio"
+    with TemporaryDirectory() as local_store:
+        downloader = AsyncHTTPDownloader()
+        jobs = [
+            (BASEURL + name, os.path.join(local_store, name))
+            for name in ["tiny-data.txt", "large-data.txt"]
+        ]
+        downloader.download_many(jobs)
+        check_tiny_data(jobs[0][1])
+        check_large_data(jobs[1][1])
+
+
+@pytest.mark.skipif(aiohttp is not None, reason="aiohttp must be missing")
+def test_async_http_downloader_fail_if_aiohttp_missing():
+    "test must fail if aiohttp is not installed"
+    with pytest.raises(ValueError) as exc:
+        AsyncHTTPDownloader()
+    assert "'aiohttp'" in str(exc.value)
+
+
 @pytest.mark.skipif(paramiko is not None, reason="paramiko must be missing")
 def test_sftp_downloader_fail_if_paramiko_missing():
     "test must fail if paramiko is not installed"
@@ -27,6 +27,9 @@ from ..hashes import (
     make_registry,
     file_hash,
     hash_matches,
+    digest_matches,
+    HashingFile,
+    HashMismatchError,
 )
 from .utils import check_tiny_data, mirror_directory
 
@@ -202,3 +205,45 @@ def test_hash_matches_uppercase(alg, expected_hash):
     with pytest.raises(ValueError) as error:
         hash_matches(fname, known_hash[:-5], strict=True, source="Neverland")
     assert "Neverland" in str(error.value)
+
+
+def test_hashing_file(tmp_path):
+    "The wrapper should hash the data as it's written to the file"
+    source = os.path.join(DATA_DIR, "tiny-data.txt")
+    check_tiny_data(source)
+    destination = str(tmp_path / "tiny-data.txt")
+    with open(source, "rb") as fin:
+        data = fin.read()
+    with open(destination, "wb") as fout:
+        wrapper = HashingFile(fout, algorithm="sha256")
+        wrapper.write(data)
+        wrapper.flush()
+    check_tiny_data(destination)
+    assert wrapper.hexdigest() == TINY_DATA_HASHES_HASHLIB["sha256"]
+    assert wrapper.hexdigest() == file_hash(destination)
+    # The file descriptor must be the wrapped file's so that downloaders can
+    # preallocate disk space through the wrapper
+    with open(destination, "rb") as fin:
+        assert HashingFile(fin).fileno() == fin.fileno()
+
+
+def test_hashing_file_invalid_algorithm(tmp_path):
+    "The wrapper should raise an error for unknown algorithms"
+    with open(tmp_path / "output.bin", "wb") as fout:
+        with pytest.raises(ValueError) as exc:
+            HashingFile(fout, algorithm="blah")
+        assert "'blah'" in str(exc.value)
+
+
+def test_digest_matches():
+    "Check a pre-computed digest against a known hash"
+    digest = TINY_DATA_HASHES_HASHLIB["sha256"]
+    assert digest_matches(digest, f"sha256:{digest}")
+    assert digest_matches(digest, digest)
+    assert digest_matches(digest, known_hash=None)
+    assert not digest_matches(digest, "sha256:blablablabla")
+    # The mismatch error is a ValueError subclass for backwards compatibility
+    with pytest.raises(HashMismatchError) as error:
+        digest_matches(digest, "sha256:blablablabla", strict=True, source="Neverland")
+    assert "Neverland" in str(error.value)
+    assert isinstance(error.value, ValueError)
@@ -11,6 +11,7 @@ import logging
 import os
 import tempfile
 import hashlib
+import functools
 from pathlib import Path
 from urllib.parse import urlsplit
 from contextlib import contextmanager
@@ -176,6 +177,20 @@ def parse_url(url):
         Three components of a URL (e.g.,
         ``{'protocol':'http', 'netloc':'127.0.0.1:8080','path': '/test.nc'}``).
 
+    """
+    protocol, netloc, path = _parse_url_parts(url)
+    return {"protocol": protocol, "netloc": netloc, "path": path}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_url_parts(url):
+    """
+    Split a URL into (protocol, netloc, path), memoizing the result.
+
+    The same URLs get parsed repeatedly when fetching many files from a
+    registry (once to choose the downloader, once in the downloader itself),
+    so the split is cached. The cache holds the immutable tuple while
+    :func:`parse_url` hands each caller a fresh dict.
     """
     if url.startswith("doi://"):
         raise ValueError(
@@ -195,7 +210,7 @@ def parse_url(url):
         protocol = parsed_url.scheme or "file"
         netloc = parsed_url.netloc
         path = parsed_url.path
-    return {"protocol": protocol, "netloc": netloc, "path": path}
+    return protocol, netloc, path
 
 
 def cache_location(path, env=None, version=None):